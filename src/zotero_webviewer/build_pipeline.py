@@ -1,39 +1,49 @@
 """Build pipeline orchestration and file watching functionality."""
 
+import os
+import re
+import json
+import stat
+import mmap
 import time
+import pickle
 import logging
 import hashlib
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Callable, Any, Set, Tuple
+from collections import deque
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, Future
 from dataclasses import dataclass
 from datetime import datetime
 
 try:
-    from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
-    WATCHDOG_AVAILABLE = True
+    from watchfiles import awatch, Change
+    WATCHFILES_AVAILABLE = True
 except ImportError:
-    WATCHDOG_AVAILABLE = False
-    # Create dummy classes when watchdog is not available
-    class FileSystemEventHandler:
-        def on_modified(self, event):
-            pass
-    
-    class Observer:
-        def schedule(self, handler, path, recursive=False):
-            pass
-        def start(self):
-            pass
-        def stop(self):
-            pass
-        def join(self):
-            pass
+    WATCHFILES_AVAILABLE = False
 
-from .rdf_parser import RDFParser, RDFParsingError
 from .data_transformer import DataTransformer, DataTransformationError
 from .collection_builder import CollectionHierarchyBuilder, CollectionHierarchyError
-from .json_generator import JSONGenerator, JSONGenerationError
-from .site_generator import SiteGenerator, SiteGenerationError, SiteConfig
+from .json_generator import JSONGenerator, JSONGenerationError, load_json_bytes
+from .file_utils import scan_files
+from . import __version__
+
+if TYPE_CHECKING:
+    from .rdf_parser import RDFParser
+    from .site_generator import SiteGenerator
+
+
+# Number of recent build results kept in memory (bounds growth in watch mode)
+BUILD_HISTORY_SIZE = 256
+
+# Build state persisted in the output directory for incremental builds across runs
+BUILD_CACHE_FILENAME = ".build-cache.json"
+
+# Messages that make an integrity issue or item transform failure fail the build
+_CRITICAL_INTEGRITY_ISSUE_RE = re.compile(r"missing required field|duplicate", re.IGNORECASE)
+_CRITICAL_TRANSFORM_ERROR_RE = re.compile(r"missing required|validation", re.IGNORECASE)
 
 
 @dataclass
@@ -48,6 +58,8 @@ class BuildConfig:
     watch_mode: bool = False
     production: bool = False
     verbose: bool = False
+    cache_dir: Optional[str] = None
+    rdf_store: str = "default"
 
 
 @dataclass
@@ -73,41 +85,6 @@ class BuildPipelineError(Exception):
     pass
 
 
-class RDFFileWatcher(FileSystemEventHandler):
-    """File system event handler for watching RDF file changes."""
-    
-    def __init__(self, rdf_file_path: str, callback: Callable[[], None]):
-        self.rdf_file_path = Path(rdf_file_path).resolve()
-        self.callback = callback
-        self.logger = logging.getLogger(__name__)
-        self._last_modified = 0
-        self._debounce_delay = 1.0  # 1 second debounce
-    
-    def on_modified(self, event):
-        """Handle file modification events."""
-        if event.is_directory:
-            return
-        
-        event_path = Path(event.src_path).resolve()
-        
-        # Check if this is our target RDF file
-        if event_path == self.rdf_file_path:
-            current_time = time.time()
-            
-            # Debounce rapid file changes
-            if current_time - self._last_modified > self._debounce_delay:
-                self._last_modified = current_time
-                self.logger.info(f"RDF file changed: {event_path}")
-                
-                # Small delay to ensure file write is complete
-                time.sleep(0.5)
-                
-                try:
-                    self.callback()
-                except Exception as e:
-                    self.logger.error(f"Error during rebuild: {str(e)}")
-
-
 class BuildPipeline:
     """Orchestrates the complete RDF-to-website build pipeline."""
     
@@ -116,20 +93,72 @@ class BuildPipeline:
         self.logger = logging.getLogger(__name__)
         self._setup_logging()
         
-        # Initialize components
-        self.parser = RDFParser()
-        self.transformer = DataTransformer()
-        self.hierarchy_builder = CollectionHierarchyBuilder()
-        self.json_generator = JSONGenerator(str(Path(config.output_dir) / "data"))
-        self.site_generator = SiteGenerator(config.output_dir)
-        
         # Build state tracking
         self._last_build_hash: Optional[str] = None
-        self._build_history: List[BuildResult] = []
+        self._last_templates_state: Optional[List[List[Any]]] = None
+        self._build_history: Deque[BuildResult] = deque(maxlen=BUILD_HISTORY_SIZE)
+        
+        # Running aggregates over all builds of this pipeline, including evicted history
+        self._stats: Dict[str, Any] = {
+            "successful": 0,
+            "failed": 0,
+            "duration_sum": 0.0,
+            "duration_min": float("inf"),
+            "duration_max": 0.0,
+            "last_successful": None,
+            "last_failed": None,
+        }
+        
+        # (mtime_ns, size) of the input file and its digest, to avoid re-hashing unchanged files
+        self._last_input_stat: Optional[Tuple[int, int]] = None
+        self._last_input_hash: Optional[str] = None
+        
+        # Hashes of the data each JSON output was last generated from
+        self._output_hashes: Dict[str, str] = {}
+        
+        # Restore build state from a previous run
+        if config.incremental:
+            self._load_cache()
+        
+        # Worker threads for build stages that can overlap
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="build")
         
         # File watcher
-        self._observer: Optional[Observer] = None
-        self._file_watcher: Optional[RDFFileWatcher] = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop: Optional[threading.Event] = None
+        self._watch_target: Optional[Path] = None
+        self._watch_path: Optional[str] = None
+        self._watch_names: Set[str] = set()
+    
+    # Components are created on first use so that importing the pipeline
+    # (e.g. for CLI --help) doesn't pull in rdflib or jinja2
+    
+    @cached_property
+    def parser(self) -> "RDFParser":
+        """RDF parser for the input file."""
+        from .rdf_parser import RDFParser
+        return RDFParser(cache_dir=self.config.cache_dir, store=self.config.rdf_store)
+    
+    @cached_property
+    def transformer(self) -> DataTransformer:
+        """Transformer from raw RDF data to models."""
+        return DataTransformer()
+    
+    @cached_property
+    def hierarchy_builder(self) -> CollectionHierarchyBuilder:
+        """Builder for the collection tree."""
+        return CollectionHierarchyBuilder()
+    
+    @cached_property
+    def json_generator(self) -> JSONGenerator:
+        """Generator for the JSON data files."""
+        return JSONGenerator(str(Path(self.config.output_dir) / "data"))
+    
+    @cached_property
+    def site_generator(self) -> "SiteGenerator":
+        """Generator for the static website files."""
+        from .site_generator import SiteGenerator
+        return SiteGenerator(self.config.output_dir, cache_dir=self.config.cache_dir)
     
     def _setup_logging(self):
         """Configure logging based on verbosity setting."""
@@ -153,18 +182,23 @@ class BuildPipeline:
         Raises:
             BuildPipelineError: If the build fails
         """
+        from .rdf_parser import RDFParsingError
+        from .site_generator import SiteGenerationError, SiteConfig
+        
         start_time = time.time()
         errors = []
         warnings = []
         files_generated = []
+        written_json: Set[str] = set()
+        site_future: Optional[Future] = None
         
         def update_progress(percentage: int, message: str):
             if progress_callback:
                 progress_callback(percentage, message)
-            self.logger.info(f"[{percentage}%] {message}")
+            self.logger.info("[%d%%] %s", percentage, message)
         
         try:
-            self.logger.info(f"Starting build pipeline for {self.config.input_file}")
+            self.logger.info("Starting build pipeline for %s", self.config.input_file)
             
             # Validate inputs
             self._validate_inputs()
@@ -180,7 +214,9 @@ class BuildPipeline:
             # Step 1: Parse RDF file
             update_progress(10, "Parsing RDF file")
             try:
-                graph = self.parser.parse_rdf_file(self.config.input_file)
+                # Key parse caching on file contents so touched or copied exports still hit
+                content_hash = self._calculate_input_hash() if self.parser.cache_dir else None
+                graph = self.parser.parse_rdf_file(self.config.input_file, content_hash=content_hash)
             except RDFParsingError as e:
                 errors.append(f"RDF parsing failed: {str(e)}")
                 raise BuildPipelineError(f"RDF parsing failed: {str(e)}")
@@ -195,7 +231,7 @@ class BuildPipeline:
                 data_integrity_issues = self.parser.validate_bibliography_data_integrity(items_data)
                 if data_integrity_issues:
                     for issue in data_integrity_issues:
-                        if "missing required field" in issue.lower() or "duplicate" in issue.lower():
+                        if _CRITICAL_INTEGRITY_ISSUE_RE.search(issue):
                             errors.append(f"Data integrity error: {issue}")
                         else:
                             warnings.append(f"Data integrity warning: {issue}")
@@ -207,6 +243,14 @@ class BuildPipeline:
                     warnings.append("No bibliography items found in RDF file")
                 if not collections_data:
                     warnings.append("No collections found in RDF file")
+                
+                # Collections output depends on item membership, so chain the hashes
+                items_key = self._hash_data(items_data)
+                collections_key = self._hash_data(collections_data, items_key)
+                
+                # Everything needed is extracted; release the graph before transforming
+                graph = None
+                self.parser.graph = None
                     
             except RDFParsingError as e:
                 errors.append(f"Data extraction failed: {str(e)}")
@@ -217,23 +261,37 @@ class BuildPipeline:
             try:
                 items = []
                 transformation_errors = []
+                item_warnings = []
                 
-                for item_data in items_data:
+                # Consume the raw dicts in order so each can be freed once transformed
+                items_data.reverse()
+                while items_data:
+                    item_data = items_data.pop()
                     try:
                         item = self.transformer.transform_bibliography_item(item_data)
                         items.append(item)
                     except DataTransformationError as e:
                         item_id = item_data.get('id', 'unknown')
-                        error_msg = f"Failed to transform item {item_id}: {str(e)}"
+                        reason = str(e)
+                        error_msg = f"Failed to transform item {item_id}: {reason}"
                         
                         # Distinguish between critical errors and warnings
-                        if "missing required" in str(e).lower() or "validation" in str(e).lower():
+                        if _CRITICAL_TRANSFORM_ERROR_RE.search(reason):
                             transformation_errors.append(error_msg)
                         else:
-                            warnings.append(error_msg)
+                            item_warnings.append(error_msg)
+                
+                # Summarize item failures in one log record instead of one per item
+                failed_count = len(transformation_errors) + len(item_warnings)
+                if failed_count:
+                    self.logger.warning("Transform failed for %d items: %s", failed_count,
+                                        "; ".join((transformation_errors + item_warnings)[:3]))
+                warnings.extend(item_warnings)
                 
                 collections = []
-                for col_data in collections_data:
+                collections_data.reverse()
+                while collections_data:
+                    col_data = collections_data.pop()
                     try:
                         collection = self.transformer.transform_collection(col_data)
                         collections.append(collection)
@@ -279,17 +337,65 @@ class BuildPipeline:
                 errors.append(f"Collection hierarchy building failed: {str(e)}")
                 raise BuildPipelineError(f"Collection hierarchy building failed: {str(e)}")
             
+            # Static site files do not depend on the data, so render them
+            # while the JSON files are written
+            if not self.config.data_only:
+                site_config = SiteConfig(
+                    title="Literature Collection Webviewer",
+                    collection_title="Literature Collection",
+                    description="Interactive browser for academic literature collections exported from Zotero"
+                )
+                site_future = self._executor.submit(self.site_generator.generate_site, site_config)
+            
             # Step 5: Generate JSON files
             update_progress(70, "Generating JSON data files")
             try:
+                # Only rewrite outputs whose input data changed since the last build.
+                # Recorded hashes are dropped until all outputs are written again.
+                previous_hashes, self._output_hashes = self._output_hashes, {}
+                output_hashes = {}
+                
+                output_dir = self.json_generator.output_dir
+                
+                def is_stale(name: str, filename: str, data_key: str) -> bool:
+                    output_hashes[name] = data_key
+                    if previous_hashes.get(name) == data_key and os.path.exists(output_dir / filename):
+                        self.logger.debug("Skipping unchanged %s", filename)
+                        return False
+                    return True
+                
                 if self.config.combined_json:
-                    json_file = self.json_generator.generate_combined_data(items, root_collections)
-                    files_generated.append(json_file)
+                    if is_stale("combined", "data.json", collections_key):
+                        self.json_generator.generate_combined_data(items, root_collections)
+                        written_json.add(str(output_dir / "data.json"))
+                    files_generated.append(str(output_dir / "data.json"))
                 else:
-                    bib_file = self.json_generator.generate_bibliography_json(items)
-                    col_file = self.json_generator.generate_collections_json(root_collections)
-                    search_file = self.json_generator.generate_search_index(items)
-                    files_generated.extend([bib_file, col_file, search_file])
+                    # Bibliography and search index come from the same items and are
+                    # written in one pass over them
+                    bibliography_filename = (
+                        "bibliography.json" if is_stale("bibliography", "bibliography.json", items_key) else None
+                    )
+                    search_index_filename = (
+                        "search_index.json" if is_stale("search_index", "search_index.json", items_key) else None
+                    )
+                    self.json_generator.generate_item_files(
+                        items,
+                        bibliography_filename=bibliography_filename,
+                        search_index_filename=search_index_filename
+                    )
+                    written_json.update(
+                        str(output_dir / filename)
+                        for filename in (bibliography_filename, search_index_filename) if filename
+                    )
+                    if is_stale("collections", "collections.json", collections_key):
+                        self.json_generator.generate_collections_json(root_collections)
+                        written_json.add(str(output_dir / "collections.json"))
+                    files_generated.extend(
+                        str(output_dir / filename)
+                        for filename in ("bibliography.json", "collections.json", "search_index.json")
+                    )
+                
+                self._output_hashes = output_hashes
                     
             except JSONGenerationError as e:
                 errors.append(f"JSON generation failed: {str(e)}")
@@ -299,18 +405,12 @@ class BuildPipeline:
             if not self.config.data_only:
                 update_progress(85, "Generating static website files")
                 try:
-                    # Create site configuration
-                    site_config = SiteConfig(
-                        title="Literature Collection Webviewer",
-                        collection_title="Literature Collection",
-                        description="Interactive browser for academic literature collections exported from Zotero"
-                    )
-                    
-                    # Generate static site
-                    site_files = self.site_generator.generate_site(site_config)
+                    # Wait for the static site started after Step 4
+                    pending_site, site_future = site_future, None
+                    site_files = pending_site.result()
                     files_generated.extend(site_files)
                     
-                    self.logger.info(f"Generated {len(site_files)} static site files")
+                    self.logger.info("Generated %d static site files", len(site_files))
                     
                 except SiteGenerationError as e:
                     errors.append(f"Static site generation failed: {str(e)}")
@@ -322,7 +422,12 @@ class BuildPipeline:
             if self.config.validate_output:
                 update_progress(95, "Validating generated files")
                 try:
-                    self._validate_output(files_generated)
+                    # JSON files serialized in this run only need to have landed on disk;
+                    # ones kept from an earlier build are parsed again
+                    if written_json:
+                        self.logger.info("Skipping JSON parse check for %d data files written in this build",
+                                         len(written_json))
+                    self._validate_output(files_generated, written_json=written_json)
                 except BuildValidationError as e:
                     errors.append(f"Output validation failed: {str(e)}")
                     # Don't fail the build for validation errors, just warn
@@ -335,15 +440,20 @@ class BuildPipeline:
                     from .production_optimizer import ProductionOptimizer, DeploymentHelper
                     
                     optimizer = ProductionOptimizer(self.config.output_dir)
+                    deployment_helper = DeploymentHelper(self.config.output_dir)
+                    
+                    # The GitHub Pages marker does not depend on the optimized files,
+                    # so write it while the optimizer runs on this thread
+                    pages_future = self._executor.submit(deployment_helper.create_github_pages_config)
                     optimization_report = optimizer.optimize_all()
                     
-                    # Create deployment configuration
-                    deployment_helper = DeploymentHelper(self.config.output_dir)
-                    deployment_helper.create_github_pages_config()
+                    # Deployment info lists the optimized files; validation only reads them
+                    validation_future = self._executor.submit(deployment_helper.validate_deployment)
                     deployment_info = deployment_helper.create_deployment_info()
+                    pages_future.result()
                     
                     # Validate deployment
-                    deployment_errors = deployment_helper.validate_deployment()
+                    deployment_errors = validation_future.result()
                     if deployment_errors:
                         warnings.extend([f"Deployment validation: {error}" for error in deployment_errors])
                     
@@ -373,12 +483,20 @@ class BuildPipeline:
                 timestamp=datetime.now()
             )
             
-            self._build_history.append(result)
-            self.logger.info(f"Build completed successfully in {duration:.2f} seconds")
+            self._record_build(result)
+            self._save_cache(result)
+            self.logger.info("Build completed successfully in %.2f seconds", duration)
             
             return result
             
         except Exception as e:
+            # Don't leave site generation running behind a failed build
+            if site_future is not None and not site_future.cancel():
+                try:
+                    site_future.result()
+                except Exception:
+                    pass
+            
             duration = time.time() - start_time
             errors.append(str(e))
             
@@ -393,8 +511,8 @@ class BuildPipeline:
                 timestamp=datetime.now()
             )
             
-            self._build_history.append(result)
-            self.logger.error(f"Build failed after {duration:.2f} seconds: {str(e)}")
+            self._record_build(result)
+            self.logger.error("Build failed after %.2f seconds: %s", duration, e)
             
             raise BuildPipelineError(f"Build failed: {str(e)}")
     
@@ -402,75 +520,164 @@ class BuildPipeline:
         """
         Start file watching mode for automatic rebuilds.
         
+        The initial build and all rebuilds run in the background, so this method
+        returns as soon as the watcher has been started.
+        
         Args:
             progress_callback: Optional callback for progress updates
             
         Raises:
             BuildPipelineError: If watch mode cannot be started
         """
-        if not WATCHDOG_AVAILABLE:
+        if not WATCHFILES_AVAILABLE:
             raise BuildPipelineError(
-                "File watching requires the 'watchdog' package. "
-                "Install it with: pip install watchdog"
+                "File watching requires the 'watchfiles' package. "
+                "Install it with: pip install watchfiles"
             )
         
-        if self._observer is not None:
+        if self._watch_thread is not None:
             self.logger.warning("Watch mode is already active")
             return
         
+        import asyncio
+        
+        try:
+            # uvloop is optional; it only replaces the event loop driving the watcher
+            import uvloop
+            run_loop = uvloop.run
+        except ImportError:
+            run_loop = asyncio.run
+        
+        # Fail fast on a missing input file instead of inside the watcher thread
+        self._validate_inputs()
+        
         try:
             input_path = Path(self.config.input_file)
             watch_dir = input_path.parent
             
-            self.logger.info(f"Starting watch mode for {input_path}")
-            self.logger.info(f"Watching directory: {watch_dir}")
-            
-            # Create file watcher
-            def rebuild_callback():
-                try:
-                    self.build(progress_callback)
-                except BuildPipelineError as e:
-                    self.logger.error(f"Rebuild failed: {str(e)}")
+            self.logger.info("Starting watch mode for %s", input_path)
+            self.logger.info("Watching directory: %s", watch_dir)
             
-            self._file_watcher = RDFFileWatcher(str(input_path), rebuild_callback)
-            
-            # Set up observer
-            self._observer = Observer()
-            self._observer.schedule(self._file_watcher, str(watch_dir), recursive=False)
-            self._observer.start()
+            self._watch_target = input_path.resolve()
+            self._watch_path = os.path.abspath(input_path)
+            self._watch_names = {input_path.name, self._watch_target.name}
+            self._watch_stop = threading.Event()
+            self._watch_thread = threading.Thread(
+                target=run_loop,
+                args=(self._watch_async(watch_dir, progress_callback),),
+                name="rdf-watcher",
+                daemon=True
+            )
+            self._watch_thread.start()
             
             self.logger.info("Watch mode started. Press Ctrl+C to stop.")
             
-            # Perform initial build
-            self.build(progress_callback)
-            
         except Exception as e:
             self.stop_watch_mode()
             raise BuildPipelineError(f"Failed to start watch mode: {str(e)}")
     
     def stop_watch_mode(self) -> None:
         """Stop file watching mode."""
-        if self._observer is not None:
+        if self._watch_thread is not None:
             self.logger.info("Stopping watch mode")
-            self._observer.stop()
-            self._observer.join()
-            self._observer = None
-            self._file_watcher = None
+            self._watch_stop.set()
+            self._watch_thread.join()
+            self._watch_thread = None
+            self._watch_stop = None
+    
+    async def _watch_async(
+        self, 
+        watch_dir: Path, 
+        progress_callback: Optional[Callable[[int, str], None]] = None
+    ) -> None:
+        """Run the initial build, then rebuild whenever the input file changes until watch mode is stopped."""
+        import asyncio
+        
+        # Builds run one at a time on a worker thread so the watcher keeps collecting events
+        build_lock = asyncio.Lock()
+        
+        async def run_build(wait_for_input: bool) -> None:
+            async with build_lock:
+                try:
+                    if wait_for_input:
+                        await asyncio.to_thread(self._wait_for_stable_input)
+                    await asyncio.to_thread(self.build, progress_callback)
+                except BuildPipelineError as e:
+                    self.logger.error("Rebuild failed: %s", e)
+        
+        # The initial build overlaps watcher start-up, so edits made while it runs are not lost
+        initial_build = asyncio.create_task(run_build(wait_for_input=False))
+        
+        # watchfiles batches and debounces events, so each iteration is one burst of writes
+        async for _ in awatch(
+            watch_dir,
+            watch_filter=self._is_input_change,
+            debounce=800,
+            step=50,
+            stop_event=self._watch_stop,
+            recursive=False
+        ):
+            self.logger.info("RDF file changed: %s", self._watch_target)
+            await run_build(wait_for_input=True)
+        
+        await initial_build
+    
+    def _wait_for_stable_input(self, timeout: float = 1.0, interval: float = 0.05) -> None:
+        """
+        Wait until the input file stops changing so a rebuild doesn't read a partial write.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            interval: Time between two stat samples in seconds
+        """
+        deadline = time.monotonic() + timeout
+        previous = None
+        
+        while True:
+            try:
+                file_stat = os.stat(self.config.input_file)
+                current = (file_stat.st_size, file_stat.st_mtime_ns)
+            except OSError:
+                current = None
+            
+            if current is not None and current == previous:
+                return
+            
+            if time.monotonic() >= deadline:
+                self.logger.debug("Input file still changing after %ss, rebuilding anyway", timeout)
+                return
+            
+            previous = current
+            time.sleep(interval)
+    
+    def _is_input_change(self, change: "Change", path: str) -> bool:
+        """Return True if a file system change affects the watched input file."""
+        if change == Change.deleted:
+            return False
+        
+        # Cheap string checks first; only resolve symlinks for a possible match
+        if path == self._watch_path:
+            return True
+        if os.path.basename(path) not in self._watch_names:
+            return False
+        return Path(path).resolve() == self._watch_target
     
     def _validate_inputs(self) -> None:
         """Validate input configuration and files."""
-        input_path = Path(self.config.input_file)
-        
-        if not input_path.exists():
+        # A single stat answers both "exists" and "is a regular file"
+        try:
+            input_stat = os.stat(self.config.input_file)
+        except FileNotFoundError:
             raise BuildPipelineError(f"Input file does not exist: {self.config.input_file}")
+        except OSError as e:
+            raise BuildPipelineError(f"Cannot access input file {self.config.input_file}: {str(e)}")
         
-        if not input_path.is_file():
+        if not stat.S_ISREG(input_stat.st_mode):
             raise BuildPipelineError(f"Input path is not a file: {self.config.input_file}")
         
         # Create output directory if it doesn't exist
-        output_path = Path(self.config.output_dir)
         try:
-            output_path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(self.config.output_dir, exist_ok=True)
         except Exception as e:
             raise BuildPipelineError(f"Failed to create output directory: {str(e)}")
     
@@ -484,52 +691,179 @@ class BuildPipeline:
         if self._last_build_hash is None:
             return False
         
-        return current_hash == self._last_build_hash
+        if current_hash != self._last_build_hash:
+            return False
+        
+        # The site is rendered from the templates, so edits there need a rebuild too
+        return self._get_templates_state() == self._last_templates_state
     
     def _calculate_input_hash(self) -> str:
         """Calculate hash of input file for change detection."""
         try:
-            with open(self.config.input_file, 'rb') as f:
-                file_hash = hashlib.md5()
-                for chunk in iter(lambda: f.read(4096), b""):
-                    file_hash.update(chunk)
-                return file_hash.hexdigest()
+            # Only re-read the file when its modification time or size changed
+            file_stat = os.stat(self.config.input_file)
+            input_stat = (file_stat.st_mtime_ns, file_stat.st_size)
+            if input_stat == self._last_input_stat and self._last_input_hash is not None:
+                return self._last_input_hash
+            
+            # Hash the whole file in one update over a memory map; hashlib releases
+            # the GIL for the duration and no Python-level read loop is needed
+            file_hash = hashlib.blake2b(digest_size=16)
+            if file_stat.st_size > 0:
+                with open(self.config.input_file, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        file_hash.update(mapped)
+            
+            self._last_input_stat = input_stat
+            self._last_input_hash = file_hash.hexdigest()
+            return self._last_input_hash
         except Exception as e:
-            self.logger.warning(f"Failed to calculate input hash: {str(e)}")
+            self.logger.warning("Failed to calculate input hash: %s", e)
             return ""
     
     def _update_build_hash(self) -> None:
-        """Update the stored hash of the input file."""
+        """Update the stored hash of the input file and state of the templates."""
         self._last_build_hash = self._calculate_input_hash()
+        self._last_templates_state = self._get_templates_state()
+    
+    def _get_templates_state(self) -> List[List[Any]]:
+        """Return the relative path, size and mtime of every template file."""
+        if self.config.data_only:
+            return []
+        
+        templates_dir = str(self.site_generator.templates_dir)
+        if not os.path.isdir(templates_dir):
+            return []
+        
+        state = []
+        for entry in scan_files(templates_dir):
+            entry_stat = entry.stat()
+            state.append([os.path.relpath(entry.path, templates_dir), entry_stat.st_size, entry_stat.st_mtime_ns])
+        state.sort()
+        return state
+    
+    @staticmethod
+    def _hash_data(*objects: Any) -> str:
+        """Return a digest identifying the given extracted data."""
+        payload = pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _get_cache_path(self) -> Path:
+        """Return the path of the persisted build state file."""
+        return Path(self.config.output_dir) / BUILD_CACHE_FILENAME
     
-    def _validate_output(self, files_generated: List[str]) -> None:
+    def _get_config_fingerprint(self) -> Dict[str, Any]:
+        """Return the configuration values that affect build output."""
+        return {
+            "version": __version__,
+            "input_file": str(Path(self.config.input_file).resolve()),
+            "data_only": self.config.data_only,
+            "combined_json": self.config.combined_json,
+            "production": self.config.production,
+        }
+    
+    def _load_cache(self) -> None:
+        """
+        Restore the last successful build from the output directory.
+        
+        The cached state is ignored if it was written for a different
+        configuration or if any of the files it recorded are missing.
+        Template changes are detected later by _should_skip_build.
+        """
+        cache_path = self._get_cache_path()
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            
+            if cache.get("config") != self._get_config_fingerprint():
+                return
+            
+            # Paths are stored relative to the output directory
+            files_generated = [str(Path(self.config.output_dir) / file_path) for file_path in cache["files"]]
+            if not all(os.path.exists(file_path) for file_path in files_generated):
+                return
+            
+            result = BuildResult(
+                success=True,
+                duration=cache["duration"],
+                items_count=cache["items"],
+                collections_count=cache["collections"],
+                files_generated=files_generated,
+                errors=[],
+                warnings=cache.get("warnings", []),
+                timestamp=datetime.fromisoformat(cache["timestamp"])
+            )
+            
+            self._last_build_hash = cache["hash"]
+            self._last_templates_state = cache.get("templates")
+            self._output_hashes = cache.get("outputs", {})
+            self._record_build(result)
+            self.logger.debug("Loaded build cache from %s", cache_path)
+            
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("Ignoring invalid build cache %s: %s", cache_path, e)
+    
+    def _save_cache(self, result: BuildResult) -> None:
+        """Persist the build state of a successful build to the output directory."""
+        if not self.config.incremental or not self._last_build_hash:
+            return
+        
+        cache_path = self._get_cache_path()
+        cache = {
+            "hash": self._last_build_hash,
+            "config": self._get_config_fingerprint(),
+            "templates": self._last_templates_state,
+            "outputs": self._output_hashes,
+            "items": result.items_count,
+            "collections": result.collections_count,
+            "files": [os.path.relpath(file_path, self.config.output_dir) for file_path in result.files_generated],
+            "warnings": result.warnings,
+            "duration": result.duration,
+            "timestamp": result.timestamp.isoformat(),
+        }
+        
+        try:
+            tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning("Failed to save build cache %s: %s", cache_path, e)
+    
+    def _validate_output(self, files_generated: List[str], *, written_json: Optional[Set[str]] = None) -> None:
         """
         Validate generated output files.
         
         Args:
             files_generated: List of file paths that were generated
+            written_json: JSON files just serialized by this pipeline; these
+                are not parsed again
             
         Raises:
             BuildValidationError: If validation fails
         """
         validation_errors = []
         
-        # Validate JSON files
-        validation_results = self.json_generator.validate_json_files()
-        for file_path, is_valid in validation_results.items():
-            if not is_valid:
-                validation_errors.append(f"Invalid JSON file: {file_path}")
-        
-        # Check that all expected files were generated
+        # Check existence, size and JSON validity of each file in a single pass
         for file_path in files_generated:
-            if not Path(file_path).exists():
+            try:
+                size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 validation_errors.append(f"Expected file not found: {file_path}")
-        
-        # Validate file sizes (warn about empty files)
-        file_sizes = self.json_generator.get_file_sizes()
-        for file_path, size in file_sizes.items():
+                continue
+            
             if size == 0:
                 validation_errors.append(f"Empty file generated: {file_path}")
+                continue
+            
+            if file_path.endswith(".json") and not (written_json and file_path in written_json):
+                try:
+                    with open(file_path, 'rb') as f:
+                        load_json_bytes(f.read())
+                except (ValueError, OSError):
+                    validation_errors.append(f"Invalid JSON file: {file_path}")
         
         if validation_errors:
             raise BuildValidationError("; ".join(validation_errors))
@@ -541,33 +875,47 @@ class BuildPipeline:
         Returns:
             Dictionary with build statistics
         """
-        if not self._build_history:
+        aggregates = self._stats
+        total_builds = aggregates["successful"] + aggregates["failed"]
+        if not total_builds:
             return {"total_builds": 0}
         
-        successful_builds = [b for b in self._build_history if b.success]
-        failed_builds = [b for b in self._build_history if not b.success]
-        
         stats = {
-            "total_builds": len(self._build_history),
-            "successful_builds": len(successful_builds),
-            "failed_builds": len(failed_builds),
-            "success_rate": len(successful_builds) / len(self._build_history) * 100,
+            "total_builds": total_builds,
+            "successful_builds": aggregates["successful"],
+            "failed_builds": aggregates["failed"],
+            "success_rate": aggregates["successful"] / total_builds * 100,
         }
         
-        if successful_builds:
-            durations = [b.duration for b in successful_builds]
+        if aggregates["successful"]:
             stats.update({
-                "average_build_time": sum(durations) / len(durations),
-                "fastest_build": min(durations),
-                "slowest_build": max(durations),
-                "last_successful_build": successful_builds[-1].timestamp.isoformat(),
+                "average_build_time": aggregates["duration_sum"] / aggregates["successful"],
+                "fastest_build": aggregates["duration_min"],
+                "slowest_build": aggregates["duration_max"],
+                "last_successful_build": aggregates["last_successful"].isoformat(),
             })
         
-        if failed_builds:
-            stats["last_failed_build"] = failed_builds[-1].timestamp.isoformat()
+        if aggregates["failed"]:
+            stats["last_failed_build"] = aggregates["last_failed"].isoformat()
         
         return stats
     
+    def _record_build(self, result: BuildResult) -> None:
+        """Add a build result to the history and update the running aggregates."""
+        self._build_history.append(result)
+        
+        aggregates = self._stats
+        if result.success:
+            aggregates["successful"] += 1
+            aggregates["duration_sum"] += result.duration
+            aggregates["duration_min"] = min(aggregates["duration_min"], result.duration)
+            aggregates["duration_max"] = max(aggregates["duration_max"], result.duration)
+            aggregates["last_successful"] = result.timestamp
+        else:
+            aggregates["failed"] += 1
+            aggregates["last_failed"] = result.timestamp
+    
     def cleanup(self) -> None:
         """Clean up resources and stop any running processes."""
-        self.stop_watch_mode()
\ No newline at end of file
+        self.stop_watch_mode()
+        self._executor.shutdown(wait=True)
\ No newline at end of file
@@ -7,11 +7,10 @@ from datetime import datetime
 
 import click
 
-from .rdf_parser import RDFParser, RDFParsingError, RDFValidationError, RDFDataIntegrityError
 from .data_transformer import DataTransformer, DataTransformationError, DataValidationError, DataIntegrityError
 from .collection_builder import CollectionHierarchyBuilder, CollectionHierarchyError
 from .json_generator import JSONGenerator
-from .build_pipeline import BuildPipeline, BuildConfig, BuildPipelineError
+from .build_pipeline import BuildPipeline, BuildConfig, BuildPipelineError, BUILD_CACHE_FILENAME
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -66,9 +65,12 @@ def cli(ctx, verbose):
 @click.option('--validate/--no-validate', default=True, help='Validate generated JSON files (default: enabled)')
 @click.option('--incremental/--no-incremental', default=True, help='Enable incremental builds (default: enabled)')
 @click.option('--production', is_flag=True, help='Enable production optimizations (minification, compression)')
+@click.option('--cache/--no-cache', default=False, help='Cache parsed RDF data and compiled templates between runs (default: disabled)')
 @click.pass_context
-def build(ctx, input, output, data_only, combined, validate, incremental, production):
+def build(ctx, input, output, data_only, combined, validate, incremental, production, cache):
     """Build a static website from Zotero RDF export."""
+    from .rdf_parser import RDFParsingError, RDFValidationError, RDFDataIntegrityError, default_cache_dir
+    
     verbose = ctx.obj.get('verbose', False)
     
     try:
@@ -88,7 +90,8 @@ def build(ctx, input, output, data_only, combined, validate, incremental, produc
             validate_output=validate,
             incremental=incremental,
             production=production,
-            verbose=verbose
+            verbose=verbose,
+            cache_dir=str(default_cache_dir()) if cache else None
         )
         
         # Initialize build pipeline
@@ -163,9 +166,12 @@ def build(ctx, input, output, data_only, combined, validate, incremental, produc
 @cli.command()
 @click.option('--input', '-i', required=True, help='Input RDF file path')
 @click.option('--comprehensive', is_flag=True, help='Run comprehensive validation including data transformation')
+@click.option('--cache/--no-cache', default=False, help='Cache parsed RDF data between runs (default: disabled)')
 @click.pass_context
-def validate_rdf(ctx, input, comprehensive):
+def validate_rdf(ctx, input, comprehensive, cache):
     """Validate an RDF file without building the website."""
+    from .rdf_parser import RDFParser, RDFParsingError, RDFValidationError, RDFDataIntegrityError, default_cache_dir
+    
     verbose = ctx.obj.get('verbose', False)
     
     try:
@@ -173,7 +179,7 @@ def validate_rdf(ctx, input, comprehensive):
         
         click.echo(f"Validating RDF file: {input_path}")
         
-        parser = RDFParser()
+        parser = RDFParser(cache_dir=str(default_cache_dir()) if cache else None)
         graph = parser.parse_rdf_file(str(input_path))
         
         # Extract and count items
@@ -381,7 +387,7 @@ def info(output):
         click.echo(f"  {status} {file_name}: {size_kb:.1f} KB")
     
     # Show static files if they exist
-    static_files = ['index.html', 'styles.css', 'app.js']
+    static_files = ['index.html', 'styles.css', 'app.js', BUILD_CACHE_FILENAME]
     for static_file in static_files:
         static_path = output_path / static_file
         if static_path.exists():
@@ -409,7 +415,7 @@ def clean(output, confirm):
         files_to_clean.extend(data_dir.glob("*.json"))
     
     # Static files
-    static_files = ['index.html', 'styles.css', 'app.js']
+    static_files = ['index.html', 'styles.css', 'app.js', BUILD_CACHE_FILENAME]
     for static_file in static_files:
         static_path = output_path / static_file
         if static_path.exists():
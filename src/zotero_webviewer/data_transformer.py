@@ -7,6 +7,31 @@ from typing import List, Dict, Optional, Any, Set
 from enum import Enum
 
 
+# Patterns and lookup tables shared by all transformer calls
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+_HTML_ENTITIES = (
+    ('&amp;', '&'),
+    ('&lt;', '<'),
+    ('&gt;', '>'),
+    ('&quot;', '"'),
+    ('&#39;', "'"),
+    ('&nbsp;', ' ')
+)
+
+_NAME_PREFIXES = ('Dr.', 'Prof.', 'Mr.', 'Ms.', 'Mrs.')
+_NAME_SUFFIXES = ('Jr.', 'Sr.', 'PhD', 'Ph.D.', 'M.D.', 'MD')
+
+# Common academic keywords to look for
+_COMMON_KEYWORDS = (
+    'machine learning', 'artificial intelligence', 'deep learning',
+    'neural network', 'algorithm', 'optimization', 'classification',
+    'regression', 'clustering', 'natural language processing',
+    'computer vision', 'data mining', 'big data', 'statistics'
+)
+
+
 class ItemType(Enum):
     """Enumeration of bibliography item types."""
     ARTICLE = "article"
@@ -122,6 +147,20 @@ class Collection:
             child.update_item_count()
 
 
+_ITEM_TYPE_MAPPING = {
+    "article": ItemType.ARTICLE,
+    "journalarticle": ItemType.ARTICLE,
+    "book": ItemType.BOOK,
+    "booksection": ItemType.BOOK,
+    "conference": ItemType.CONFERENCE,
+    "conferencepaper": ItemType.CONFERENCE,
+    "thesis": ItemType.THESIS,
+    "report": ItemType.REPORT,
+    "webpage": ItemType.WEBPAGE,
+    "other": ItemType.OTHER
+}
+
+
 class DataTransformationError(Exception):
     """Exception raised when data transformation fails."""
     pass
@@ -339,21 +378,8 @@ class DataTransformer:
     
     def _normalize_item_type(self, item_type: str) -> ItemType:
         """Normalize item type string to ItemType enum."""
-        type_mapping = {
-            "article": ItemType.ARTICLE,
-            "journalarticle": ItemType.ARTICLE,
-            "book": ItemType.BOOK,
-            "booksection": ItemType.BOOK,
-            "conference": ItemType.CONFERENCE,
-            "conferencepaper": ItemType.CONFERENCE,
-            "thesis": ItemType.THESIS,
-            "report": ItemType.REPORT,
-            "webpage": ItemType.WEBPAGE,
-            "other": ItemType.OTHER
-        }
-        
         normalized = item_type.lower().replace("_", "").replace("-", "")
-        return type_mapping.get(normalized, ItemType.OTHER)
+        return _ITEM_TYPE_MAPPING.get(normalized, ItemType.OTHER)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
@@ -361,23 +387,16 @@ class DataTransformer:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_RE.sub(' ', text.strip())
         
         # Remove HTML tags if present
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
         
         # Decode common HTML entities
-        html_entities = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' '
-        }
-        
-        for entity, replacement in html_entities.items():
-            text = text.replace(entity, replacement)
+        if '&' in text:
+            for entity, replacement in _HTML_ENTITIES:
+                text = text.replace(entity, replacement)
         
         return text.strip()
     
@@ -390,14 +409,11 @@ class DataTransformer:
         name = self._clean_text(name)
         
         # Remove common prefixes/suffixes
-        prefixes = ['Dr.', 'Prof.', 'Mr.', 'Ms.', 'Mrs.']
-        suffixes = ['Jr.', 'Sr.', 'PhD', 'Ph.D.', 'M.D.', 'MD']
-        
-        for prefix in prefixes:
+        for prefix in _NAME_PREFIXES:
             if name.startswith(prefix + ' '):
                 name = name[len(prefix):].strip()
         
-        for suffix in suffixes:
+        for suffix in _NAME_SUFFIXES:
             if name.endswith(' ' + suffix):
                 name = name[:-len(suffix)].strip()
         
@@ -463,15 +479,7 @@ class DataTransformer:
         # This is a simple implementation - could be enhanced with NLP
         text = f"{title} {abstract}".lower()
         
-        # Common academic keywords to look for
-        common_keywords = [
-            'machine learning', 'artificial intelligence', 'deep learning',
-            'neural network', 'algorithm', 'optimization', 'classification',
-            'regression', 'clustering', 'natural language processing',
-            'computer vision', 'data mining', 'big data', 'statistics'
-        ]
-        
-        for keyword in common_keywords:
+        for keyword in _COMMON_KEYWORDS:
             if keyword in text:
                 keywords.append(keyword)
         
@@ -603,7 +611,7 @@ class DataTransformer:
             # Check for suspicious characters
             if any(char in url for char in [' ', '\n', '\r', '\t']):
                 self.logger.warning(f"Item {item_id} has {url_type} with whitespace characters")
-                url = re.sub(r'\s+', '', url)  # Remove whitespace
+                url = _WHITESPACE_RE.sub('', url)  # Remove whitespace
             
             return url
             
@@ -0,0 +1,27 @@
+"""Filesystem helpers shared by the site generator and production optimizer."""
+
+import os
+from typing import Iterator
+
+
+def scan_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield a directory entry for every file below a directory.
+    
+    Entries carry the file type from the directory listing and cache their
+    stat result, so walking the tree costs no per-file stat calls beyond
+    the first size lookup.
+    
+    Args:
+        root: Directory to walk
+        
+    Yields:
+        os.DirEntry for each regular file, in no particular order
+    """
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry
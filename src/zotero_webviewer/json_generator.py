@@ -3,9 +3,29 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from .data_transformer import BibliographyItem, Collection
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class JSONGenerationError(Exception):
     """Exception raised when JSON generation fails."""
@@ -42,31 +62,12 @@ class JSONGenerator:
             self.logger.info(f"Generating bibliography JSON for {len(items)} items")
             
             # Convert items to optimized dictionary format
-            items_data = []
-            for item in items:
-                item_dict = item.to_dict()
-                
-                # Optimize the data structure for client-side use
-                optimized_item = self._optimize_bibliography_item(item_dict)
-                items_data.append(optimized_item)
-            
-            # Sort items by title for consistent ordering
-            items_data.sort(key=lambda x: x.get("title", "").lower())
-            
-            # Create the final JSON structure
-            json_data = {
-                "metadata": {
-                    "total_items": len(items_data),
-                    "generated_at": self._get_timestamp(),
-                    "version": "1.0"
-                },
-                "items": items_data
-            }
+            items_data = [self._optimize_bibliography_item(item.to_dict()) for item in items]
+            json_data = self._create_bibliography_data(items_data)
             
             # Write to file
             output_path = self.output_dir / filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            self._write_json(output_path, json_data)
             
             self.logger.info(f"Generated bibliography JSON: {output_path}")
             return str(output_path)
@@ -121,8 +122,7 @@ class JSONGenerator:
             
             # Write to file
             output_path = self.output_dir / filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            self._write_json(output_path, json_data)
             
             self.logger.info(f"Generated collections JSON: {output_path}")
             return str(output_path)
@@ -151,38 +151,12 @@ class JSONGenerator:
         try:
             self.logger.info(f"Generating search index for {len(items)} items")
             
-            search_data = []
-            for item in items:
-                # Create searchable text combining multiple fields
-                searchable_text = self._create_searchable_text(item)
-                
-                search_entry = {
-                    "id": item.id,
-                    "title": item.title,
-                    "authors": item.get_author_names(),
-                    "year": item.year,
-                    "venue": item.venue,
-                    "type": item.type.value,
-                    "searchable": searchable_text,
-                    "keywords": item.keywords
-                }
-                
-                search_data.append(search_entry)
-            
-            # Create the search index structure
-            json_data = {
-                "metadata": {
-                    "total_items": len(search_data),
-                    "generated_at": self._get_timestamp(),
-                    "version": "1.0"
-                },
-                "index": search_data
-            }
+            search_data = [self._create_search_entry(item) for item in items]
+            json_data = self._create_search_index_data(search_data)
             
             # Write to file
             output_path = self.output_dir / filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            self._write_json(output_path, json_data)
             
             self.logger.info(f"Generated search index: {output_path}")
             return str(output_path)
@@ -190,6 +164,61 @@ class JSONGenerator:
         except Exception as e:
             raise JSONGenerationError(f"Failed to generate search index: {str(e)}")
     
+    def generate_item_files(
+        self,
+        items: List[BibliographyItem],
+        bibliography_filename: Optional[str] = "bibliography.json",
+        search_index_filename: Optional[str] = "search_index.json"
+    ) -> Dict[str, str]:
+        """
+        Generate the bibliography JSON and search index in a single pass over the items.
+        
+        Both files are derived from the same items, so each item is converted for
+        both outputs at once instead of walking the item list twice.
+        
+        Args:
+            items: List of BibliographyItem objects
+            bibliography_filename: Output filename for the bibliography, or None to skip it
+            search_index_filename: Output filename for the search index, or None to skip it
+            
+        Returns:
+            Dictionary mapping "bibliography" and "search_index" to the generated file paths
+            
+        Raises:
+            JSONGenerationError: If JSON generation fails
+        """
+        if not bibliography_filename and not search_index_filename:
+            return {}
+        
+        try:
+            self.logger.info(f"Generating bibliography JSON and search index for {len(items)} items")
+            
+            items_data = []
+            search_data = []
+            for item in items:
+                if bibliography_filename:
+                    items_data.append(self._optimize_bibliography_item(item.to_dict()))
+                if search_index_filename:
+                    search_data.append(self._create_search_entry(item))
+            
+            generated = {}
+            if bibliography_filename:
+                output_path = self.output_dir / bibliography_filename
+                self._write_json(output_path, self._create_bibliography_data(items_data))
+                self.logger.info(f"Generated bibliography JSON: {output_path}")
+                generated["bibliography"] = str(output_path)
+            
+            if search_index_filename:
+                output_path = self.output_dir / search_index_filename
+                self._write_json(output_path, self._create_search_index_data(search_data))
+                self.logger.info(f"Generated search index: {output_path}")
+                generated["search_index"] = str(output_path)
+            
+            return generated
+            
+        except Exception as e:
+            raise JSONGenerationError(f"Failed to generate item data files: {str(e)}")
+    
     def generate_combined_data(
         self, 
         items: List[BibliographyItem], 
@@ -243,8 +272,7 @@ class JSONGenerator:
             
             # Write to file
             output_path = self.output_dir / filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            self._write_json(output_path, json_data)
             
             self.logger.info(f"Generated combined data file: {output_path}")
             return str(output_path)
@@ -252,6 +280,73 @@ class JSONGenerator:
         except Exception as e:
             raise JSONGenerationError(f"Failed to generate combined data: {str(e)}")
     
+    def _write_json(self, output_path: Path, data: Any) -> None:
+        """Write data as JSON to the given path."""
+        with open(output_path, 'wb') as f:
+            f.write(dump_json_bytes(data))
+    
+    def _create_bibliography_data(self, items_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Wrap optimized bibliography items in the bibliography file structure.
+        
+        Args:
+            items_data: Optimized item dictionaries, sorted in place by title
+            
+        Returns:
+            Bibliography JSON structure
+        """
+        # Sort items by title for consistent ordering
+        items_data.sort(key=lambda x: x.get("title", "").lower())
+        
+        return {
+            "metadata": {
+                "total_items": len(items_data),
+                "generated_at": self._get_timestamp(),
+                "version": "1.0"
+            },
+            "items": items_data
+        }
+    
+    def _create_search_index_data(self, search_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Wrap search entries in the search index file structure.
+        
+        Args:
+            search_data: Search entries in item order
+            
+        Returns:
+            Search index JSON structure
+        """
+        return {
+            "metadata": {
+                "total_items": len(search_data),
+                "generated_at": self._get_timestamp(),
+                "version": "1.0"
+            },
+            "index": search_data
+        }
+    
+    def _create_search_entry(self, item: BibliographyItem) -> Dict[str, Any]:
+        """
+        Create the search index entry for a single item.
+        
+        Args:
+            item: BibliographyItem object
+            
+        Returns:
+            Search index entry dictionary
+        """
+        return {
+            "id": item.id,
+            "title": item.title,
+            "authors": item.get_author_names(),
+            "year": item.year,
+            "venue": item.venue,
+            "type": item.type.value,
+            "searchable": self._create_searchable_text(item),
+            "keywords": item.keywords
+        }
+    
     def _optimize_bibliography_item(self, item_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Optimize bibliography item dictionary for client-side use.
@@ -475,8 +570,8 @@ class JSONGenerator:
         
         for file_path in self.get_output_files():
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                with open(file_path, 'rb') as f:
+                    load_json_bytes(f.read())
                 validation_results[file_path] = True
                 self.logger.debug(f"JSON validation passed: {file_path}")
             except json.JSONDecodeError as e:
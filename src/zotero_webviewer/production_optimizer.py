@@ -1,16 +1,454 @@
 """Production optimization utilities for minification and compression."""
 
+import os
 import re
 import json
+import mmap
 import gzip
+import hashlib
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .file_utils import scan_files
+from .json_generator import dump_json_bytes, load_json_bytes
+
+# Optional native JSON parser and serializer for the data files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional compiled minifiers; the regex implementations below are the fallback
+try:
+    import rcssmin
+    RCSSMIN_AVAILABLE = True
+except ImportError:
+    RCSSMIN_AVAILABLE = False
+
+try:
+    import rjsmin
+    RJSMIN_AVAILABLE = True
+except ImportError:
+    RJSMIN_AVAILABLE = False
+
+try:
+    import minify_html
+    MINIFY_HTML_AVAILABLE = True
+except ImportError:
+    MINIFY_HTML_AVAILABLE = False
+
+# Optional libdeflate binding; faster than zlib and smaller output at level 12
+try:
+    import deflate
+    DEFLATE_AVAILABLE = True
+except ImportError:
+    DEFLATE_AVAILABLE = False
+
+# Optional encoders for pre-compressed .br and .zst files
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Below this much input, starting worker processes costs more than minifying in-process
+PARALLEL_MIN_BYTES = 512 * 1024
+
+# Workers are not forked from the (possibly multi-threaded) build process, where
+# a lock held by another thread, e.g. a logging lock, would stay locked in the child
+_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+_FILE_KIND_LABELS = {'css': 'CSS', 'js': 'JavaScript', 'json': 'JSON', 'html': 'HTML'}
+
+# Files of these types get pre-compressed siblings
+_COMPRESS_EXTENSIONS = frozenset({'.html', '.css', '.js', '.json'})
+
+# Records the optimized files of the last run so unchanged ones can be skipped
+MANIFEST_FILENAME = '.optimizer-manifest.json'
+_MANIFEST_VERSION = 2
+
+# Minifier patterns, compiled once at import
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# One CSS pass: string literals are kept verbatim, a trailing semicolon before
+# "}" is dropped, punctuation absorbs surrounding gaps (whitespace and comments)
+# and any other gap becomes a single space. The comment pattern can only end at
+# the first "*/", so backtracking cannot stretch a comment over real CSS.
+_CSS_GAP = r'(?:\s|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)'
+_CSS_TOKEN_RE = re.compile(
+    r'''(?=[\s/"'{}:;,>+~])'''  # cheap rejection of positions that cannot start a token
+    r'(?:(?P<string>"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')'
+    rf'|{_CSS_GAP}*(?P<close>;){_CSS_GAP}*}}{_CSS_GAP}*'
+    rf'|{_CSS_GAP}*(?P<punct>[{{}}:;,>+~]){_CSS_GAP}*'
+    rf'|(?P<gap>{_CSS_GAP}+))',
+    re.DOTALL
+)
+
+# JavaScript tokens for the fallback minifier. String, template and regex
+# literals are copied verbatim; only the gaps between tokens are rewritten.
+_JS_TOKEN_RE = re.compile(
+    r'(?P<space>\s+)'
+    r'|(?P<comment>//[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)'
+    r'|(?P<string>"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'|(?P<template>`)'
+    r'|(?P<slash>/)'
+    r'|(?P<punct>[=+\-*<>!&|{}();,])'
+    r'|(?P<word>[^\s"\'`/=+\-*<>!&|{}();,]+)'
+    r'|(?P<other>.)',
+    re.DOTALL
+)
+_JS_STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'', re.DOTALL)
+_JS_REGEX_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+# Whitespace next to these characters can be dropped
+_JS_OPERATORS = frozenset('=+-*/<>!&|{}();,')
+# A "/" after one of these characters or keywords starts a regex literal, not a division
+_JS_REGEX_PRECEDERS = frozenset('(,=:[!&|?{};~+-*%<>^')
+_JS_REGEX_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+})
+# HTML is minified as raw UTF-8 bytes, so its patterns are bytes patterns
+_HTML_COMMENT_RE = re.compile(rb'<!--(?!\[if).*?-->', re.DOTALL)
+_HTML_BETWEEN_TAGS_RE = re.compile(rb'>\s+<')
+_HTML_LINE_BREAK_RE = re.compile(rb'\s*\n\s*')
+
+# Vendor bundles shipped pre-minified, e.g. "lib.min.js" or "lib-min.css"
+_MINIFIED_NAME_RE = re.compile(r'[.-]min\.(?:js|css)$')
+
+# Average line length above which a script or stylesheet is treated as minified
+MINIFIED_LINE_LENGTH = 500
+
+
+def _minify_css_token(match: 're.Match[str]') -> str:
+    """Return the minified replacement for one match of _CSS_TOKEN_RE."""
+    kind = match.lastgroup
+    if kind == 'close':
+        return '}'
+    if kind != 'gap':
+        return match.group(kind)
+    
+    # A gap made only of comments joins its neighbours; otherwise it is one space
+    gap = match.group(kind)
+    if '/*' not in gap:
+        return ' '
+    return ' ' if _BLOCK_COMMENT_RE.sub('', gap) else ''
+
+
+def _minify_html_bytes(html_content: bytes) -> bytes:
+    """Minify UTF-8 encoded HTML without decoding it.
+    
+    Each pass is a separate substitution: every pattern starts with a literal
+    byte that the regex engine can search for, which measured faster than a
+    single alternation that has to call back into Python per match.
+    """
+    # Remove HTML comments (but preserve conditional comments)
+    html_content = _HTML_COMMENT_RE.sub(b'', html_content)
+    
+    # Remove unnecessary whitespace between tags
+    html_content = _HTML_BETWEEN_TAGS_RE.sub(b'><', html_content)
+    
+    # Remove leading/trailing whitespace on lines and drop blank lines
+    return _HTML_LINE_BREAK_RE.sub(b'\n', html_content).strip()
+
+
+def _scan_js_template(source: str, start: int) -> int:
+    """Return the index just past the template literal opening at ``start``.
+    
+    Substitutions (``${...}``) are followed to their closing brace so that
+    strings and nested template literals inside them do not end the scan early.
+    """
+    length = len(source)
+    i = start + 1
+    while i < length:
+        char = source[i]
+        if char == '\\':
+            i += 2
+        elif char == '`':
+            return i + 1
+        elif source.startswith('${', i):
+            i += 2
+            depth = 1
+            while i < length and depth:
+                char = source[i]
+                if char == '`':
+                    i = _scan_js_template(source, i)
+                    continue
+                if char in '"\'':
+                    match = _JS_STRING_RE.match(source, i)
+                    if match:
+                        i = match.end()
+                        continue
+                elif char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+                i += 1
+        else:
+            i += 1
+    return length
+
+
+def _iter_js_tokens(source: str) -> Iterator[Tuple[str, str]]:
+    """Split JavaScript source into ``(kind, text)`` tokens.
+    
+    Kinds are ``space``, ``comment`` and ``code``; literals are single ``code``
+    tokens. Whether a ``/`` starts a regex literal is decided from the previous
+    code token, the same heuristic jsmin uses.
+    """
+    pos = 0
+    length = len(source)
+    previous = ''
+    while pos < length:
+        match = _JS_TOKEN_RE.match(source, pos)
+        kind = match.lastgroup
+        end = match.end()
+        if kind == 'template':
+            end = _scan_js_template(source, pos)
+        elif kind == 'slash' and (
+            not previous
+            or previous[-1] in _JS_REGEX_PRECEDERS
+            or previous in _JS_REGEX_KEYWORDS
+        ):
+            regex = _JS_REGEX_RE.match(source, pos)
+            if regex:
+                end = regex.end()
+        
+        text = source[pos:end]
+        pos = end
+        if kind == 'space' or kind == 'comment':
+            yield kind, text
+        else:
+            previous = text
+            yield 'code', text
+
+
+def _compress(data: bytes) -> bytes:
+    """Compress bytes into a gzip member, using libdeflate when available.
+    
+    The header carries no timestamp, so identical content always produces
+    identical .gz files across builds.
+    """
+    if DEFLATE_AVAILABLE:
+        return deflate.gzip_compress(data, 12)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _write_compressed_files(file_path: str, data: bytes) -> int:
+    """Write pre-compressed siblings of a file from its in-memory content.
+    
+    A .gz file is always written; .br and .zst files are added when the
+    brotli and zstandard packages are installed. Siblings that already hold
+    the same bytes are left alone so their mtime is kept.
+    
+    Args:
+        file_path: Path of the uncompressed file
+        data: Content of the uncompressed file
+        
+    Returns:
+        Size of the gzip version in bytes
+    """
+    compressed = _compress(data)
+    variants = [('.gz', compressed)]
+    if BROTLI_AVAILABLE:
+        variants.append(('.br', brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)))
+    if ZSTANDARD_AVAILABLE:
+        variants.append(('.zst', zstandard.ZstdCompressor(level=22).compress(data)))
+    
+    for suffix, content in variants:
+        sibling_path = file_path + suffix
+        try:
+            if os.path.getsize(sibling_path) == len(content):
+                with open(sibling_path, 'rb') as f:
+                    if f.read() == content:
+                        continue
+        except OSError:
+            pass
+        with open(sibling_path, 'wb') as f:
+            f.write(content)
+    
+    return len(compressed)
+
+
+def _existing_compressed_size(file_path: str) -> Optional[int]:
+    """Return the .gz size if every compressed sibling of a file exists.
+    
+    Whether the siblings match the file is not checked here; callers compare
+    the file content with the digest recorded in the manifest, since copied
+    assets keep their source mtime and mtime order says nothing.
+    
+    Args:
+        file_path: Path of the uncompressed file
+        
+    Returns:
+        Size of the gzip version in bytes, or None if any sibling is missing
+    """
+    suffixes = ['.gz']
+    if BROTLI_AVAILABLE:
+        suffixes.append('.br')
+    if ZSTANDARD_AVAILABLE:
+        suffixes.append('.zst')
+    
+    try:
+        sibling_stats = [os.stat(file_path + suffix) for suffix in suffixes]
+    except OSError:
+        return None
+    return sibling_stats[0].st_size
+
+
+def _write_optimized_file(file_path: str, minified: bytes, unchanged: bool) -> int:
+    """Write minified content and its compressed siblings.
+    
+    Content that minification left unchanged is not rewritten, which keeps
+    its mtime for rsync and CDN uploads; the same holds for compressed
+    siblings whose bytes do not change.
+    
+    Args:
+        file_path: Path of the file
+        minified: Minified content
+        unchanged: Whether the minified content equals what is on disk
+        
+    Returns:
+        Size of the gzip version in bytes
+    """
+    if not unchanged:
+        with open(file_path, 'wb') as f:
+            f.write(minified)
+    
+    return _write_compressed_files(file_path, minified)
+
+
+def _is_minified(file_path: str, content: bytes) -> bool:
+    """Check whether a script or stylesheet is already minified.
+    
+    Args:
+        file_path: Path to the file
+        content: Content of the file
+        
+    Returns:
+        True if the file name says so or the first lines are very long
+    """
+    if _MINIFIED_NAME_RE.search(file_path):
+        return True
+    
+    sample_size = min(len(content), 4096)
+    line_count = content.count(b'\n', 0, sample_size) + 1
+    return sample_size / line_count > MINIFIED_LINE_LENGTH
+
+
+def _load_json_file(file_path: str) -> Tuple[Any, int]:
+    """Parse a JSON file, reading it through a memory map when orjson is available.
+    
+    orjson parses straight from the mapped pages, so no bytes copy of a
+    large data file is made before its objects are built.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        Tuple of (parsed data, file size in bytes)
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not ORJSON_AVAILABLE or size == 0:
+            return json.loads(f.read()), size
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view), size
+
+
+def _content_digest(content: bytes) -> str:
+    """Return the manifest digest of file content."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _optimize_file(
+    kind: str,
+    file_path: str,
+    previous: Optional[Tuple[str, int, int]] = None
+) -> Tuple[str, int, int, int, str]:
+    """Minify a single file in place and write its compressed siblings.
+    
+    The file is read once; the minified bytes are written and compressed
+    from memory. This is a module-level function so it can run in a
+    worker process.
+    
+    Args:
+        kind: File kind, one of 'css', 'js', 'json' or 'html'
+        file_path: Path to the file to optimize
+        previous: Manifest entry of (digest, original size, optimized size)
+            from the last run. A file that still has the recorded optimized
+            content and all its compressed siblings is left alone.
+        
+    Returns:
+        Tuple of (file path, original size, optimized size, compressed size,
+        digest of the optimized content)
+    """
+    if previous is not None:
+        digest, original_size, optimized_size = previous
+        # Rewritten sources are almost always larger than the minified output
+        if os.path.getsize(file_path) == optimized_size:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            compressed_size = _existing_compressed_size(file_path)
+            if compressed_size is not None and _content_digest(content) == digest:
+                logger.debug(f"Skipping unchanged {file_path}")
+                return file_path, original_size, optimized_size, compressed_size, digest
+    
+    if kind == 'json':
+        # Compact JSON
+        data, original_size = _load_json_file(file_path)
+        if ORJSON_AVAILABLE:
+            minified = orjson.dumps(data)
+        else:
+            minified = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        
+        # Only a file of the same size can already be compact
+        unchanged = False
+        if len(minified) == original_size:
+            with open(file_path, 'rb') as f:
+                unchanged = f.read() == minified
+        compressed_size = _write_optimized_file(file_path, minified, unchanged)
+        
+        return file_path, original_size, len(minified), compressed_size, _content_digest(minified)
+    
+    with open(file_path, 'rb') as f:
+        original = f.read()
+    
+    if kind in ('css', 'js') and _is_minified(file_path, original):
+        # Only compress; minifying again gains nothing and can break vendor code
+        compressed_size = _write_optimized_file(file_path, original, True)
+        return file_path, len(original), len(original), compressed_size, _content_digest(original)
+    
+    if kind == 'html' and not MINIFY_HTML_AVAILABLE:
+        minified = _minify_html_bytes(original)
+    else:
+        minify = {
+            'css': ProductionOptimizer._minify_css,
+            'js': ProductionOptimizer._minify_javascript,
+            'html': ProductionOptimizer._minify_html,
+        }[kind]
+        minified = minify(original.decode('utf-8')).encode('utf-8')
+    
+    compressed_size = _write_optimized_file(file_path, minified, minified == original)
+    
+    return file_path, len(original), len(minified), compressed_size, _content_digest(minified)
+
 
 class ProductionOptimizer:
     """Handles production optimizations like minification and compression."""
@@ -36,32 +474,113 @@ class ProductionOptimizer:
         """
         logger.info("Starting production optimization...")
         
-        # Optimize CSS
-        css_files = list(self.output_dir.glob("*.css"))
-        for css_file in css_files:
-            self.optimize_css(css_file)
-        
-        # Optimize JavaScript
-        js_files = list(self.output_dir.glob("*.js"))
-        for js_file in js_files:
-            self.optimize_javascript(js_file)
-        
-        # Optimize JSON data files
-        json_files = list(self.output_dir.glob("data/*.json"))
-        for json_file in json_files:
-            self.optimize_json(json_file)
+        tasks, other_files, total_size = self._collect_files()
+        root = str(self.output_dir)
+        manifest, compressed_manifest = self._load_manifest()
+        
+        # Files are independent, so large outputs are minified on all cores
+        kinds = [kind for kind, _ in tasks]
+        paths = [file_path for _, file_path in tasks]
+        previous = [manifest.get(os.path.relpath(file_path, root)) for file_path in paths]
+        if len(tasks) > 1 and total_size >= PARALLEL_MIN_BYTES:
+            with ProcessPoolExecutor(
+                max_workers=min(len(tasks), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context(_POOL_START_METHOD)
+            ) as executor:
+                results = list(executor.map(_optimize_file, kinds, paths, previous))
+        else:
+            results = list(map(_optimize_file, kinds, paths, previous))
         
-        # Optimize HTML
-        html_files = list(self.output_dir.glob("*.html"))
-        for html_file in html_files:
-            self.optimize_html(html_file)
+        new_manifest = {}
+        for kind, (file_path, original_size, optimized_size, compressed_size, digest) in zip(kinds, results):
+            self._record_file_stats(kind, file_path, original_size, optimized_size, compressed_size)
+            new_manifest[os.path.relpath(file_path, root)] = (digest, original_size, optimized_size)
         
-        # Generate compressed versions
-        self.generate_compressed_files()
+        # Minified files already have their compressed versions
+        compressed_digests = self.generate_compressed_files(other_files, compressed_manifest)
+        self._save_manifest(new_manifest, compressed_digests)
         
         # Generate optimization report
         return self.generate_report()
     
+    def _load_manifest(self) -> Tuple[Dict[str, Tuple[str, int, int]], Dict[str, str]]:
+        """Load the manifest written by the previous optimization run.
+        
+        Returns:
+            Tuple of (mapping of relative path to (digest, original size,
+            optimized size) for minified files, mapping of relative path to
+            content digest for files that were only compressed); both empty
+            if there is no usable manifest
+        """
+        manifest_path = self.output_dir / MANIFEST_FILENAME
+        try:
+            with open(manifest_path, 'rb') as f:
+                manifest = load_json_bytes(f.read())
+            if manifest.get('version') != _MANIFEST_VERSION:
+                return {}, {}
+            files = {
+                rel_path: (entry[0], entry[1], entry[2])
+                for rel_path, entry in manifest['files'].items()
+            }
+            return files, dict(manifest['compressed'])
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable optimizer manifest {manifest_path}: {e}")
+            return {}, {}
+    
+    def _save_manifest(self, entries: Dict[str, Tuple[str, int, int]], compressed: Dict[str, str]) -> None:
+        """Atomically replace the optimizer manifest.
+        
+        Args:
+            entries: Mapping of relative path to (digest, original size, optimized size)
+            compressed: Mapping of relative path to content digest for compressed-only files
+        """
+        manifest_path = self.output_dir / MANIFEST_FILENAME
+        manifest = {'version': _MANIFEST_VERSION, 'files': entries, 'compressed': compressed}
+        try:
+            tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(dump_json_bytes(manifest))
+            os.replace(tmp_path, manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to save optimizer manifest {manifest_path}: {e}")
+    
+    def _collect_files(self) -> Tuple[List[Tuple[str, str]], List[Path], int]:
+        """Find the files to minify and the other files to compress in one directory walk.
+        
+        Returns:
+            Tuple of (list of (kind, path) minification tasks, list of other
+            compressible files, total size of the files to minify in bytes)
+        """
+        buckets = {kind: [] for kind in _FILE_KIND_LABELS}
+        other_files = []
+        tasks_size = 0
+        root = str(self.output_dir)
+        data_dir = os.path.join(root, 'data')
+        
+        for entry in scan_files(root):
+            # Dotfiles such as the build cache and the manifest are not served
+            suffix = os.path.splitext(entry.name)[1]
+            if suffix not in _COMPRESS_EXTENSIONS or entry.name.startswith('.'):
+                continue
+            
+            # Site files live at the top level, JSON data files in data/
+            parent = os.path.dirname(entry.path)
+            if suffix == '.json':
+                kind = 'json' if parent == data_dir else None
+            else:
+                kind = suffix[1:] if parent == root else None
+            
+            if kind is None:
+                other_files.append(Path(entry.path))
+            else:
+                buckets[kind].append(entry.path)
+                tasks_size += entry.stat().st_size
+        
+        tasks = [(kind, file_path) for kind, paths in buckets.items() for file_path in sorted(paths)]
+        return tasks, other_files, tasks_size
+    
     def optimize_css(self, css_file: Path) -> None:
         """Minify CSS file.
         
@@ -69,27 +588,7 @@ class ProductionOptimizer:
             css_file: Path to CSS file to optimize
         """
         logger.debug(f"Optimizing CSS: {css_file}")
-        
-        original_size = css_file.stat().st_size
-        self.stats['original_sizes'][str(css_file)] = original_size
-        
-        with open(css_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Minify CSS
-        minified = self._minify_css(content)
-        
-        with open(css_file, 'w', encoding='utf-8') as f:
-            f.write(minified)
-        
-        optimized_size = css_file.stat().st_size
-        self.stats['optimized_sizes'][str(css_file)] = optimized_size
-        self.stats['compression_ratios'][str(css_file)] = (
-            (original_size - optimized_size) / original_size * 100
-        )
-        
-        logger.debug(f"CSS optimized: {original_size} -> {optimized_size} bytes "
-                    f"({self.stats['compression_ratios'][str(css_file)]:.1f}% reduction)")
+        self._record_file_stats('css', *_optimize_file('css', str(css_file))[:4])
     
     def optimize_javascript(self, js_file: Path) -> None:
         """Minify JavaScript file.
@@ -98,27 +597,7 @@ class ProductionOptimizer:
             js_file: Path to JavaScript file to optimize
         """
         logger.debug(f"Optimizing JavaScript: {js_file}")
-        
-        original_size = js_file.stat().st_size
-        self.stats['original_sizes'][str(js_file)] = original_size
-        
-        with open(js_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Minify JavaScript
-        minified = self._minify_javascript(content)
-        
-        with open(js_file, 'w', encoding='utf-8') as f:
-            f.write(minified)
-        
-        optimized_size = js_file.stat().st_size
-        self.stats['optimized_sizes'][str(js_file)] = optimized_size
-        self.stats['compression_ratios'][str(js_file)] = (
-            (original_size - optimized_size) / original_size * 100
-        )
-        
-        logger.debug(f"JavaScript optimized: {original_size} -> {optimized_size} bytes "
-                    f"({self.stats['compression_ratios'][str(js_file)]:.1f}% reduction)")
+        self._record_file_stats('js', *_optimize_file('js', str(js_file))[:4])
     
     def optimize_json(self, json_file: Path) -> None:
         """Optimize JSON file by removing whitespace.
@@ -127,25 +606,7 @@ class ProductionOptimizer:
             json_file: Path to JSON file to optimize
         """
         logger.debug(f"Optimizing JSON: {json_file}")
-        
-        original_size = json_file.stat().st_size
-        self.stats['original_sizes'][str(json_file)] = original_size
-        
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Write compact JSON
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
-        
-        optimized_size = json_file.stat().st_size
-        self.stats['optimized_sizes'][str(json_file)] = optimized_size
-        self.stats['compression_ratios'][str(json_file)] = (
-            (original_size - optimized_size) / original_size * 100
-        )
-        
-        logger.debug(f"JSON optimized: {original_size} -> {optimized_size} bytes "
-                    f"({self.stats['compression_ratios'][str(json_file)]:.1f}% reduction)")
+        self._record_file_stats('json', *_optimize_file('json', str(json_file))[:4])
     
     def optimize_html(self, html_file: Path) -> None:
         """Minify HTML file.
@@ -154,59 +615,98 @@ class ProductionOptimizer:
             html_file: Path to HTML file to optimize
         """
         logger.debug(f"Optimizing HTML: {html_file}")
+        self._record_file_stats('html', *_optimize_file('html', str(html_file))[:4])
+    
+    def _record_file_stats(
+        self, 
+        kind: str, 
+        file_path: str, 
+        original_size: int, 
+        optimized_size: int, 
+        compressed_size: int
+    ) -> None:
+        """Record size statistics for an optimized file.
         
-        original_size = html_file.stat().st_size
-        self.stats['original_sizes'][str(html_file)] = original_size
-        
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Minify HTML
-        minified = self._minify_html(content)
-        
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(minified)
-        
-        optimized_size = html_file.stat().st_size
-        self.stats['optimized_sizes'][str(html_file)] = optimized_size
-        self.stats['compression_ratios'][str(html_file)] = (
-            (original_size - optimized_size) / original_size * 100
-        )
+        Args:
+            kind: File kind, one of 'css', 'js', 'json' or 'html'
+            file_path: Path to the optimized file
+            original_size: Size before optimization in bytes
+            optimized_size: Size after optimization in bytes
+            compressed_size: Size of the gzip version in bytes
+        """
+        ratio = (original_size - optimized_size) / original_size * 100 if original_size else 0.0
+        self.stats['original_sizes'][file_path] = original_size
+        self.stats['optimized_sizes'][file_path] = optimized_size
+        self.stats['compression_ratios'][file_path] = ratio
         
-        logger.debug(f"HTML optimized: {original_size} -> {optimized_size} bytes "
-                    f"({self.stats['compression_ratios'][str(html_file)]:.1f}% reduction)")
+        logger.debug(f"{_FILE_KIND_LABELS[kind]} optimized: {original_size} -> {optimized_size} bytes "
+                    f"({ratio:.1f}% reduction), {compressed_size} bytes compressed")
     
-    def generate_compressed_files(self) -> None:
-        """Generate gzip compressed versions of static files."""
+    def generate_compressed_files(
+        self,
+        files: Optional[Iterable[Path]] = None,
+        previous: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Generate pre-compressed versions of static files.
+        
+        Args:
+            files: Files to compress; defaults to all compressible files in the output directory
+            previous: Mapping of relative path to content digest from the last run;
+                files whose content still matches keep their compressed versions
+            
+        Returns:
+            Mapping of relative path to the digest of the compressed content
+        """
         logger.debug("Generating compressed files...")
         
-        # Files to compress
-        compress_extensions = ['.html', '.css', '.js', '.json']
+        if files is None:
+            files = [
+                Path(entry.path) for entry in scan_files(str(self.output_dir))
+                if os.path.splitext(entry.name)[1] in _COMPRESS_EXTENSIONS
+            ]
+        
+        files = list(files)
+        root = str(self.output_dir)
+        previous = previous or {}
+        rel_paths = [os.path.relpath(file_path, root) for file_path in files]
+        previous_digests = [previous.get(rel_path) for rel_path in rel_paths]
+        
+        # zlib, libdeflate, brotli and zstd release the GIL while compressing,
+        # so threads compress several files at once
+        if len(rel_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(rel_paths), os.cpu_count() or 1)) as executor:
+                digests = list(executor.map(self._create_compressed_files, files, previous_digests))
+        else:
+            digests = list(map(self._create_compressed_files, files, previous_digests))
         
-        for file_path in self.output_dir.rglob('*'):
-            if file_path.is_file() and file_path.suffix in compress_extensions:
-                self._create_gzip_file(file_path)
+        return dict(zip(rel_paths, digests))
     
-    def _create_gzip_file(self, file_path: Path) -> None:
-        """Create a gzip compressed version of a file.
+    def _create_compressed_files(self, file_path: Path, previous_digest: Optional[str] = None) -> str:
+        """Create compressed versions of a file.
         
         Args:
             file_path: Path to file to compress
+            previous_digest: Digest of the content last compressed for this file
+            
+        Returns:
+            Digest of the compressed content
         """
-        gzip_path = file_path.with_suffix(file_path.suffix + '.gz')
+        data = file_path.read_bytes()
+        digest = _content_digest(data)
+        if digest == previous_digest and _existing_compressed_size(str(file_path)) is not None:
+            logger.debug(f"Compressed versions of {file_path.name} are up to date")
+            return digest
         
-        with open(file_path, 'rb') as f_in:
-            with gzip.open(gzip_path, 'wb') as f_out:
-                f_out.write(f_in.read())
-        
-        original_size = file_path.stat().st_size
-        compressed_size = gzip_path.stat().st_size
-        compression_ratio = (original_size - compressed_size) / original_size * 100
+        original_size = len(data)
+        compressed_size = _write_compressed_files(str(file_path), data)
+        compression_ratio = (original_size - compressed_size) / original_size * 100 if original_size else 0.0
         
         logger.debug(f"Compressed {file_path.name}: {original_size} -> {compressed_size} bytes "
                     f"({compression_ratio:.1f}% reduction)")
+        return digest
     
-    def _minify_css(self, css_content: str) -> str:
+    @staticmethod
+    def _minify_css(css_content: str) -> str:
         """Minify CSS content.
         
         Args:
@@ -215,24 +715,13 @@ class ProductionOptimizer:
         Returns:
             Minified CSS content
         """
-        # Remove comments
-        css_content = re.sub(r'/\*.*?\*/', '', css_content, flags=re.DOTALL)
-        
-        # Remove unnecessary whitespace
-        css_content = re.sub(r'\s+', ' ', css_content)
+        if RCSSMIN_AVAILABLE:
+            return rcssmin.cssmin(css_content)
         
-        # Remove whitespace around specific characters
-        css_content = re.sub(r'\s*([{}:;,>+~])\s*', r'\1', css_content)
-        
-        # Remove trailing semicolons before closing braces
-        css_content = re.sub(r';\s*}', '}', css_content)
-        
-        # Remove leading/trailing whitespace
-        css_content = css_content.strip()
-        
-        return css_content
+        return _CSS_TOKEN_RE.sub(_minify_css_token, css_content).strip()
     
-    def _minify_javascript(self, js_content: str) -> str:
+    @staticmethod
+    def _minify_javascript(js_content: str) -> str:
         """Basic JavaScript minification.
         
         Args:
@@ -241,32 +730,43 @@ class ProductionOptimizer:
         Returns:
             Minified JavaScript content
         """
-        # Remove single-line comments (but preserve URLs)
-        js_content = re.sub(r'(?<!:)//.*?(?=\n|$)', '', js_content)
-        
-        # Remove multi-line comments
-        js_content = re.sub(r'/\*.*?\*/', '', js_content, flags=re.DOTALL)
-        
-        # Remove unnecessary whitespace (but preserve string literals)
-        lines = []
-        in_string = False
-        string_char = None
-        
-        for line in js_content.split('\n'):
-            if not line.strip():
-                continue
-            
-            # Basic whitespace reduction
-            line = re.sub(r'\s+', ' ', line.strip())
-            
-            # Remove whitespace around operators (basic)
-            line = re.sub(r'\s*([=+\-*/<>!&|{}();,])\s*', r'\1', line)
-            
-            lines.append(line)
-        
-        return '\n'.join(lines)
+        if RJSMIN_AVAILABLE:
+            return rjsmin.jsmin(js_content)
+        
+        # Drop comments and collapse whitespace between tokens. Line breaks are
+        # kept because automatic semicolon insertion depends on them; spaces are
+        # dropped next to operators unless that would fuse "+ +" or "/ /".
+        parts: List[str] = []
+        previous = ''
+        gap = ''
+        for kind, text in _iter_js_tokens(js_content):
+            if kind == 'space':
+                if '\n' in text:
+                    gap = '\n'
+                elif not gap:
+                    gap = ' '
+            elif kind == 'comment':
+                if text.startswith('/*'):
+                    if '\n' in text:
+                        gap = '\n'
+                    elif not gap:
+                        gap = ' '
+            else:
+                if gap and previous:
+                    if gap == '\n':
+                        parts.append(gap)
+                    elif previous[-1] + text[0] in ('++', '--', '//', '/*'):
+                        parts.append(gap)
+                    elif previous[-1] not in _JS_OPERATORS and text[0] not in _JS_OPERATORS:
+                        parts.append(gap)
+                parts.append(text)
+                previous = text
+                gap = ''
+        
+        return ''.join(parts)
     
-    def _minify_html(self, html_content: str) -> str:
+    @staticmethod
+    def _minify_html(html_content: str) -> str:
         """Minify HTML content.
         
         Args:
@@ -275,16 +775,10 @@ class ProductionOptimizer:
         Returns:
             Minified HTML content
         """
-        # Remove HTML comments (but preserve conditional comments)
-        html_content = re.sub(r'<!--(?!\[if).*?-->', '', html_content, flags=re.DOTALL)
-        
-        # Remove unnecessary whitespace between tags
-        html_content = re.sub(r'>\s+<', '><', html_content)
+        if MINIFY_HTML_AVAILABLE:
+            return minify_html.minify(html_content, minify_css=True, minify_js=True, keep_closing_tags=True)
         
-        # Remove leading/trailing whitespace on lines
-        lines = [line.strip() for line in html_content.split('\n') if line.strip()]
-        
-        return '\n'.join(lines)
+        return _minify_html_bytes(html_content.encode('utf-8')).decode('utf-8')
     
     def generate_report(self) -> Dict[str, any]:
         """Generate optimization report.
@@ -329,6 +823,27 @@ class DeploymentHelper:
             output_dir: Directory containing the generated files
         """
         self.output_dir = Path(output_dir)
+        self._file_index: Optional[List[Tuple[str, int]]] = None
+        self._file_index_lock = threading.Lock()
+    
+    def _get_file_index(self) -> List[Tuple[str, int]]:
+        """Return the relative path and size of every file in the output directory.
+        
+        The directory is walked once per helper and the result is shared by
+        create_deployment_info and validate_deployment, which the build
+        pipeline runs on different threads.
+        
+        Returns:
+            List of (path relative to the output directory, size in bytes) tuples
+        """
+        with self._file_index_lock:
+            if self._file_index is None:
+                root = str(self.output_dir)
+                self._file_index = [
+                    (os.path.relpath(entry.path, root), entry.stat().st_size)
+                    for entry in scan_files(root)
+                ]
+            return self._file_index
     
     def create_github_pages_config(self) -> None:
         """Create configuration files for GitHub Pages deployment."""
@@ -356,22 +871,22 @@ class DeploymentHelper:
         }
         
         # Collect file information
-        for file_path in self.output_dir.rglob('*'):
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                relative_path = file_path.relative_to(self.output_dir)
-                file_size = file_path.stat().st_size
+        for rel_path, file_size in self._get_file_index():
+            name = os.path.basename(rel_path)
+            if not name.startswith('.'):
+                suffix = os.path.splitext(name)[1]
                 
                 deployment_info['files'].append({
-                    'path': str(relative_path),
+                    'path': rel_path,
                     'size': file_size,
-                    'type': file_path.suffix[1:] if file_path.suffix else 'unknown'
+                    'type': suffix[1:] if suffix else 'unknown'
                 })
                 deployment_info['total_size'] += file_size
         
         # Write deployment info
         info_path = self.output_dir / 'deployment-info.json'
-        with open(info_path, 'w', encoding='utf-8') as f:
-            json.dump(deployment_info, f, indent=2, ensure_ascii=False)
+        with open(info_path, 'wb') as f:
+            f.write(dump_json_bytes(deployment_info))
         
         logger.info(f"Deployment info created: {len(deployment_info['files'])} files, "
                    f"{deployment_info['total_size'] / 1024:.1f} KB total")
@@ -385,12 +900,13 @@ class DeploymentHelper:
             List of validation errors (empty if valid)
         """
         errors = []
+        file_index = self._get_file_index()
+        present_files = {rel_path for rel_path, _ in file_index}
         
         # Check required files
         required_files = ['index.html', 'styles.css', 'app.js']
         for required_file in required_files:
-            file_path = self.output_dir / required_file
-            if not file_path.exists():
+            if required_file not in present_files:
                 errors.append(f"Missing required file: {required_file}")
         
         # Check data directory
@@ -399,15 +915,16 @@ class DeploymentHelper:
             errors.append("Missing data directory")
         else:
             # Check for JSON files
-            json_files = list(data_dir.glob('*.json'))
-            if not json_files:
+            has_json = any(
+                os.path.dirname(rel_path) == 'data' and rel_path.endswith('.json')
+                for rel_path in present_files
+            )
+            if not has_json:
                 errors.append("No JSON data files found in data directory")
         
         # Check file sizes (warn about very large files)
-        for file_path in self.output_dir.rglob('*'):
-            if file_path.is_file():
-                file_size = file_path.stat().st_size
-                if file_size > 10 * 1024 * 1024:  # 10MB
-                    errors.append(f"Large file detected: {file_path.name} ({file_size / 1024 / 1024:.1f} MB)")
+        for rel_path, file_size in file_index:
+            if file_size > 10 * 1024 * 1024:  # 10MB
+                errors.append(f"Large file detected: {os.path.basename(rel_path)} ({file_size / 1024 / 1024:.1f} MB)")
         
         return errors
\ No newline at end of file
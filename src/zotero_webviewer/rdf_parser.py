@@ -1,10 +1,19 @@
 """RDF parsing functionality for Zotero exports."""
 
+import os
+import stat
+import pickle
+import hashlib
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+import rdflib
 from rdflib import Graph, Namespace, URIRef
 from rdflib.namespace import RDF, DC, DCTERMS, FOAF
+from rdflib.plugin import PluginException
+
+from . import __version__
 
 
 # Define Zotero-specific namespaces
@@ -14,6 +23,73 @@ LINK = Namespace("http://purl.org/rss/1.0/modules/link/")
 VCARD = Namespace("http://nwalsh.com/rdf/vCard#")
 PRISM = Namespace("http://prismstandard.org/namespaces/1.2/basic/")
 
+# Container membership properties are rdf:_1, rdf:_2, ...
+RDF_MEMBER_PREFIX = str(RDF) + "_"
+
+# Part of every parse cache key. Bump it whenever the extracted items or
+# collections change shape or content, so entries written by an older
+# extractor of the same release are not served.
+_CACHE_FORMAT_VERSION = 1
+
+# RDF types of bibliography items and the item type each maps to
+_ITEM_RDF_TYPES = (
+    (BIB.Article, "article"),
+    (BIB.Book, "book"),
+    (BIB.ConferencePaper, "conference"),
+    (BIB.Thesis, "thesis")
+)
+
+# Item properties read by _extract_item_data. A dict lookup is far cheaper
+# than comparing the predicate against each URIRef in turn.
+_ITEM_PREDICATE_FIELDS = {
+    DC.title: "title",
+    BIB.authors: "authors",
+    DC.date: "date",
+    DCTERMS.abstract: "abstract",
+    DCTERMS.isPartOf: "part_of",
+    DC.publisher: "publisher",
+    DC.identifier: "identifier",
+    LINK.link: "link",
+}
+
+# Author properties read by _extract_author_data; parsed predicates are
+# never the namespace's own URIRef objects, so identity checks cannot help
+_AUTHOR_PREDICATE_FIELDS = {
+    FOAF.givenName: "given_name",
+    FOAF.surname: "surname",
+}
+
+# Identifier URLs starting with one of these are DOIs
+_DOI_PREFIXES = (
+    "https://doi.org/", "http://doi.org/",
+    "https://dx.doi.org/", "http://dx.doi.org/",
+    "https://www.doi.org/", "http://www.doi.org/",
+)
+
+# Typed subjects with one of these types are not bibliography items
+_NON_ITEM_TYPES = frozenset({Z.Attachment, BIB.Memo})
+
+# Subjects found only through bib:authors are also skipped if they are
+# collections or venues
+_NON_ITEM_TYPES_UNTYPED = _NON_ITEM_TYPES | {Z.Collection, BIB.Journal, BIB.Proceedings}
+
+# Zotero item types mapped to the normalized item types; anything else is "other"
+_TYPE_MAPPING = {
+    "journalArticle": "article",
+    "conferencePaper": "conference",
+    "book": "book",
+    "bookSection": "book",
+    "thesis": "thesis",
+    "report": "report",
+    "webpage": "webpage",
+}
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user directory used for cached parse results."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "zotero-webviewer"
+
 
 class RDFParsingError(Exception):
     """Exception raised when RDF parsing fails."""
@@ -33,16 +109,44 @@ class RDFDataIntegrityError(RDFParsingError):
 class RDFParser:
     """Parser for Zotero RDF exports."""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, max_cache_entries: int = 16, store: str = "default"):
+        """
+        Initialize the parser.
+        
+        Args:
+            cache_dir: Directory for caching parse and extraction results
+                keyed by file path, size and mtime (disabled if None)
+            max_cache_entries: Number of cache entries kept before the least
+                recently used ones are evicted
+            store: rdflib store plugin holding parsed graphs, e.g. "Oxigraph"
+                when oxrdflib is installed
+        """
         self.logger = logging.getLogger(__name__)
         self.graph = None
-        
-    def parse_rdf_file(self, file_path: str) -> Graph:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_cache_entries = max_cache_entries
+        self.store = store
+        
+        # Cache state for the most recently parsed file
+        self._cache_path: Optional[Path] = None
+        self._cached_items: Optional[List[Dict[str, Any]]] = None
+        self._cached_collections: Optional[List[Dict[str, Any]]] = None
+        self._pending_items: Optional[List[Dict[str, Any]]] = None
+        self._pending_collections: Optional[List[Dict[str, Any]]] = None
+        
+        # Venue and publisher names resolved during an extraction pass,
+        # keyed by node; many items share the same journal or publisher
+        self._venue_cache: Optional[Dict[Any, str]] = None
+        self._publisher_cache: Optional[Dict[Any, str]] = None
+        
+    def parse_rdf_file(self, file_path: str, content_hash: Optional[str] = None) -> Graph:
         """
         Parse an RDF file and return the RDF graph.
         
         Args:
             file_path: Path to the RDF file
+            content_hash: Digest of the file contents; if given, cache entries are
+                keyed by content instead of path, size and modification time
             
         Returns:
             RDF graph object
@@ -54,26 +158,38 @@ class RDFParser:
         try:
             file_path = Path(file_path)
             
-            # Validate file existence and accessibility
-            if not file_path.exists():
+            # Validate file existence with a single stat; unreadable files
+            # surface as PermissionError when the parser opens them
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError:
                 raise RDFParsingError(f"RDF file not found: {file_path}")
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise RDFParsingError(f"Path is not a file: {file_path}")
             
             # Check file size (warn about very large files)
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size == 0:
                 raise RDFValidationError(f"RDF file is empty: {file_path}")
             
             if file_size > 100 * 1024 * 1024:  # 100MB
                 self.logger.warning(f"Large RDF file detected ({file_size / 1024 / 1024:.1f}MB): {file_path}")
             
-            # Check file permissions
-            if not file_path.stat().st_mode & 0o444:  # Check read permission
-                raise RDFParsingError(f"No read permission for RDF file: {file_path}")
+            # Serve graph and extraction results from the cache when the file is unchanged
+            self._cached_items = None
+            self._cached_collections = None
+            self._pending_items = None
+            self._pending_collections = None
+            self._cache_path = self._get_cache_path(file_path, file_stat, content_hash)
+            if self._cache_path is not None and self._load_cache():
+                self.logger.info(f"Loaded cached parse results for RDF file: {file_path}")
+                return self.graph
                 
-            self.graph = Graph()
+            try:
+                self.graph = Graph(store=self.store)
+            except PluginException as e:
+                raise RDFParsingError(f"RDF store '{self.store}' is not available: {str(e)}")
             
             # Bind namespaces for cleaner queries
             self.graph.bind("z", Z)
@@ -88,6 +204,8 @@ class RDFParser:
             # Parse the RDF file with enhanced error handling
             try:
                 self.graph.parse(file_path, format="xml")
+            except PermissionError:
+                raise
             except Exception as parse_error:
                 # Try to provide more specific error information
                 error_msg = str(parse_error).lower()
@@ -136,34 +254,71 @@ class RDFParser:
             
         if graph is None:
             raise RDFParsingError("No RDF graph available. Call parse_rdf_file first.")
+        
+        if self._cached_items is not None and graph is self.graph:
+            items, self._cached_items = self._cached_items, None
+            self.logger.info(f"Using {len(items)} cached bibliography items")
+            return items
+        
+        items = list(self.iter_bibliography_items(graph))
+        self.logger.info(f"Extracted {len(items)} bibliography items")
+        self._store_cache(graph, items=items)
+        return items
+    
+    def iter_bibliography_items(self, graph: Optional[Graph] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield bibliography items from the RDF graph one at a time.
+        
+        Unlike extract_bibliography_items, results are neither served from
+        nor written to the parse cache.
+        
+        Args:
+            graph: RDF graph to extract from (uses instance graph if None)
+            
+        Yields:
+            Dictionaries containing bibliography item data
+            
+        Raises:
+            RDFParsingError: If extraction fails
+        """
+        if graph is None:
+            graph = self.graph
             
-        items = []
+        if graph is None:
+            raise RDFParsingError("No RDF graph available. Call parse_rdf_file first.")
+        
+        self._venue_cache = {}
+        self._publisher_cache = {}
         
         try:
-            # Query for different types of bibliography items
-            item_types = [
-                (BIB.Article, "article"),
-                (BIB.Book, "book"),
-                (BIB.ConferencePaper, "conference"),
-                (BIB.Thesis, "thesis")
-            ]
-            
             processed_subjects = set()
             
+            # Index rdf:type in a single pass so the skip checks below are set
+            # operations instead of store lookups per subject. The same pass
+            # collects the subjects of each item type, replacing a
+            # subjects(RDF.type, ...) scan per type.
+            types_of: Dict[Any, set] = {}
+            typed_subjects: Dict[Any, list] = {rdf_type: [] for rdf_type, _ in _ITEM_RDF_TYPES}
+            for subject, _, rdf_type in graph.triples((None, RDF.type, None)):
+                types_of.setdefault(subject, set()).add(rdf_type)
+                subjects_of_type = typed_subjects.get(rdf_type)
+                if subjects_of_type is not None:
+                    subjects_of_type.append(subject)
+            no_types = frozenset()
+            
             # First, find items by explicit RDF types
-            for rdf_type, item_type in item_types:
-                for subject in graph.subjects(RDF.type, rdf_type):
+            for rdf_type, item_type in _ITEM_RDF_TYPES:
+                for subject in typed_subjects[rdf_type]:
                     if subject in processed_subjects:
                         continue
                         
                     # Skip attachments and memos
-                    if (subject, RDF.type, Z.Attachment) in graph or \
-                       (subject, RDF.type, BIB.Memo) in graph:
+                    if not _NON_ITEM_TYPES.isdisjoint(types_of[subject]):
                         continue
                         
                     item_data = self._extract_item_data(graph, subject, item_type)
                     if item_data:
-                        items.append(item_data)
+                        yield item_data
                         processed_subjects.add(subject)
             
             # Also check for items with z:itemType but no explicit RDF.type
@@ -177,7 +332,7 @@ class RDFParser:
                     
                 item_data = self._extract_item_data(graph, subject, str(item_type_literal))
                 if item_data:
-                    items.append(item_data)
+                    yield item_data
                     processed_subjects.add(subject)
             
             # Finally, look for subjects that have bibliographic properties but weren't caught above
@@ -188,11 +343,7 @@ class RDFParser:
                     continue
                     
                 # Skip attachments, memos, collections, and venue entities
-                if (subject, RDF.type, Z.Attachment) in graph or \
-                   (subject, RDF.type, BIB.Memo) in graph or \
-                   (subject, RDF.type, Z.Collection) in graph or \
-                   (subject, RDF.type, BIB.Journal) in graph or \
-                   (subject, RDF.type, BIB.Proceedings) in graph:
+                if not _NON_ITEM_TYPES_UNTYPED.isdisjoint(types_of.get(subject, no_types)):
                     continue
                 
                 # Only include if it has authors (strong indicator of bibliography item)
@@ -200,14 +351,14 @@ class RDFParser:
                 if graph.value(subject, BIB.authors) and graph.value(subject, DC.title):
                     item_data = self._extract_item_data(graph, subject, "other")
                     if item_data:
-                        items.append(item_data)
+                        yield item_data
                         processed_subjects.add(subject)
             
-            self.logger.info(f"Extracted {len(items)} bibliography items")
-            return items
-            
         except Exception as e:
             raise RDFParsingError(f"Failed to extract bibliography items: {str(e)}")
+        finally:
+            self._venue_cache = None
+            self._publisher_cache = None
     
     def extract_collections(self, graph: Optional[Graph] = None) -> List[Dict[str, Any]]:
         """
@@ -227,18 +378,32 @@ class RDFParser:
             
         if graph is None:
             raise RDFParsingError("No RDF graph available. Call parse_rdf_file first.")
+        
+        if self._cached_collections is not None and graph is self.graph:
+            collections, self._cached_collections = self._cached_collections, None
+            self.logger.info(f"Using {len(collections)} cached collections")
+            return collections
             
         collections = []
         
         try:
+            # Index collection membership in a single pass over dcterms:hasPart
+            # instead of querying the graph once per collection
+            parts_by_collection: Dict[URIRef, List[str]] = {}
+            for container, _, part in graph.triples((None, DCTERMS.hasPart, None)):
+                parts_by_collection.setdefault(container, []).append(str(part))
+            
             # In Zotero RDF, collections are specifically marked with z:Collection type
             # This distinguishes them from venues (bib:Journal) and other entities
             for subject in graph.subjects(RDF.type, Z.Collection):
-                collection_data = self._extract_collection_data(graph, subject)
+                collection_data = self._extract_collection_data(
+                    graph, subject, parts_by_collection.get(subject, [])
+                )
                 if collection_data:
                     collections.append(collection_data)
             
             self.logger.info(f"Extracted {len(collections)} collections")
+            self._store_cache(graph, collections=collections)
             return collections
             
         except Exception as e:
@@ -260,18 +425,22 @@ class RDFParser:
             # Create a mapping from item ID to item data for quick lookup
             items_by_id = {item["id"]: item for item in items_data}
             
-            # For each collection, add the collection ID to its items
+            # Gather each item's collection IDs in a dict used as an ordered
+            # set, so duplicates are dropped without scanning a list
+            collection_ids_by_item: Dict[str, Dict[str, None]] = {}
             for collection in collections_data:
                 collection_id = collection["id"]
                 for item_id in collection.get("item_ids", []):
                     if item_id in items_by_id:
-                        # Initialize collections list if it doesn't exist
-                        if "collections" not in items_by_id[item_id]:
-                            items_by_id[item_id]["collections"] = []
-                        
-                        # Add collection ID if not already present
-                        if collection_id not in items_by_id[item_id]["collections"]:
-                            items_by_id[item_id]["collections"].append(collection_id)
+                        collection_ids_by_item.setdefault(item_id, {})[collection_id] = None
+            
+            # Append the new IDs to each item's collections, keeping existing ones first
+            for item_id, collection_ids in collection_ids_by_item.items():
+                item_collections = items_by_id[item_id].setdefault("collections", [])
+                known_ids = set(item_collections)
+                item_collections.extend(
+                    collection_id for collection_id in collection_ids if collection_id not in known_ids
+                )
             
             # Count assignments for logging
             assigned_count = sum(1 for item in items_data if item.get("collections"))
@@ -280,9 +449,110 @@ class RDFParser:
         except Exception as e:
             self.logger.error(f"Failed to assign items to collections: {str(e)}")
     
+    def _get_cache_path(
+        self, 
+        file_path: Path, 
+        file_stat: os.stat_result, 
+        content_hash: Optional[str] = None
+    ) -> Optional[Path]:
+        """Return the cache file for the given RDF file state, or None if caching is disabled."""
+        if self.cache_dir is None:
+            return None
+        
+        if content_hash:
+            file_key = [content_hash]
+        else:
+            file_key = [str(file_path.resolve()), str(file_stat.st_size), str(file_stat.st_mtime_ns)]
+        
+        key_source = "|".join(
+            file_key + [__version__, str(_CACHE_FORMAT_VERSION), rdflib.__version__, self.store]
+        )
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.pkl"
+    
+    def _load_cache(self) -> bool:
+        """
+        Load graph and extraction results from the cache file.
+        
+        Returns:
+            True if the cache entry was loaded, False on a miss or unreadable entry
+        """
+        try:
+            with open(self._cache_path, "rb") as f:
+                graph, items, collections = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {self._cache_path}: {str(e)}")
+            return False
+        
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(self._cache_path)
+        except OSError:
+            pass
+        
+        self.graph = graph
+        self._cached_items = items
+        self._cached_collections = collections
+        return True
+    
+    def _store_cache(
+        self, 
+        graph: Graph, 
+        items: Optional[List[Dict[str, Any]]] = None, 
+        collections: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Record extraction results and write the cache entry once both are known.
+        
+        Only results extracted from the graph returned by parse_rdf_file are cached.
+        """
+        if self._cache_path is None or graph is not self.graph:
+            return
+        
+        if items is not None:
+            self._pending_items = items
+        if collections is not None:
+            self._pending_collections = collections
+        
+        if self._pending_items is None or self._pending_collections is None:
+            return
+        
+        cache_path, self._cache_path = self._cache_path, None
+        cache_entry = (graph, self._pending_items, self._pending_collections)
+        self._pending_items = None
+        self._pending_collections = None
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(cache_entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self._evict_cache_entries()
+        except Exception as e:
+            self.logger.warning(f"Failed to write parse cache {cache_path}: {str(e)}")
+    
+    def _evict_cache_entries(self) -> None:
+        """Remove the least recently used cache entries beyond max_cache_entries."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pkl") and entry.is_file():
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+        
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_cache_entries:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def _extract_item_data(self, graph: Graph, subject: URIRef, item_type: str) -> Optional[Dict[str, Any]]:
         """Extract data for a single bibliography item."""
         try:
+            # Ids stay builtin str: URIRef never compares equal to a plain
+            # str, so dict lookups by id downstream would silently miss.
             item_data = {
                 "id": str(subject),
                 "type": self._normalize_item_type(item_type),
@@ -298,36 +568,54 @@ class RDFParser:
                 "attachments": []
             }
             
+            # One sweep over the subject's triples instead of a lookup per
+            # property; like graph.value, the first object of a predicate wins
+            values: Dict[str, Any] = {}
+            identifiers = []
+            attachments = []
+            for predicate, obj in graph.predicate_objects(subject):
+                field = _ITEM_PREDICATE_FIELDS.get(predicate)
+                if field is None:
+                    continue
+                if field == "identifier":
+                    identifiers.append(obj)
+                elif field == "link":
+                    attachments.append(obj)
+                elif field not in values:
+                    values[field] = obj
+            title = values.get("title")
+            authors_seq = values.get("authors")
+            date = values.get("date")
+            abstract = values.get("abstract")
+            part_of = values.get("part_of")
+            publisher = values.get("publisher")
+            
             # Extract title
-            title = graph.value(subject, DC.title)
             if title:
                 item_data["title"] = str(title)
             
             # Extract authors
-            authors_seq = graph.value(subject, BIB.authors)
             if authors_seq:
                 item_data["authors"] = self._extract_authors(graph, authors_seq)
             
             # Extract publication year from date
-            date = graph.value(subject, DC.date)
             if date:
                 item_data["year"] = self._extract_year_from_date(str(date))
             
             # Extract venue/journal information
-            venue = self._extract_venue(graph, subject)
+            venue = self._resolve_venue(graph, part_of, publisher)
             if venue:
                 item_data["venue"] = venue
             
             # Extract abstract
-            abstract = graph.value(subject, DCTERMS.abstract)
             if abstract:
                 item_data["abstract"] = str(abstract)
             
             # Extract DOI and URL
-            for identifier in graph.objects(subject, DC.identifier):
+            for identifier in identifiers:
                 if isinstance(identifier, URIRef):
                     url_str = str(identifier)
-                    if "doi.org" in url_str:
+                    if url_str.startswith(_DOI_PREFIXES):
                         item_data["doi"] = url_str
                     else:
                         item_data["url"] = url_str
@@ -336,13 +624,13 @@ class RDFParser:
                     uri_value = graph.value(identifier, RDF.value)
                     if uri_value:
                         url_str = str(uri_value)
-                        if "doi.org" in url_str:
+                        if url_str.startswith(_DOI_PREFIXES):
                             item_data["doi"] = url_str
                         else:
                             item_data["url"] = url_str
             
             # Extract attachments
-            for attachment in graph.objects(subject, LINK.link):
+            for attachment in attachments:
                 attachment_data = self._extract_attachment_data(graph, attachment)
                 if attachment_data:
                     item_data["attachments"].append(attachment_data)
@@ -357,8 +645,20 @@ class RDFParser:
             self.logger.warning(f"Failed to extract data for item {subject}: {str(e)}")
             return None
     
-    def _extract_collection_data(self, graph: Graph, subject: URIRef) -> Optional[Dict[str, Any]]:
-        """Extract data for a single collection."""
+    def _extract_collection_data(
+        self, 
+        graph: Graph, 
+        subject: URIRef, 
+        parts: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract data for a single collection.
+        
+        Args:
+            graph: RDF graph to extract from
+            subject: Collection node
+            parts: Pre-indexed member ids; queried from the graph if None
+        """
         try:
             collection_data = {
                 "id": str(subject),
@@ -373,8 +673,9 @@ class RDFParser:
                 collection_data["title"] = str(title)
             
             # Extract items that belong to this collection
-            for item in graph.objects(subject, DCTERMS.hasPart):
-                collection_data["item_ids"].append(str(item))
+            if parts is None:
+                parts = [str(item) for item in graph.objects(subject, DCTERMS.hasPart)]
+            collection_data["item_ids"] = list(parts)
             
             # Only return collections with a title
             if collection_data["title"]:
@@ -391,15 +692,22 @@ class RDFParser:
         authors = []
         
         try:
-            # RDF sequences use rdf:_1, rdf:_2, etc.
+            # One sweep over the sequence node's triples. RDF sequences use
+            # rdf:_1, rdf:_2, etc.; the other objects are only needed below.
+            members: Dict[int, Any] = {}
+            objects = []
+            for predicate, obj in graph.predicate_objects(authors_seq):
+                objects.append(obj)
+                predicate_str = str(predicate)
+                if predicate_str.startswith(RDF_MEMBER_PREFIX):
+                    index = predicate_str[len(RDF_MEMBER_PREFIX):]
+                    if index.isdecimal():
+                        members.setdefault(int(index), obj)
+            
+            # Members are read in order up to the first gap
             seq_index = 1
-            while True:
-                # Create the sequence property URI
-                seq_prop = URIRef(f"http://www.w3.org/1999/02/22-rdf-syntax-ns#_{seq_index}")
-                author_node = graph.value(authors_seq, seq_prop)
-                
-                if not author_node:
-                    break
+            while members.get(seq_index):
+                author_node = members[seq_index]
                 
                 # Check if this is a foaf:Person and extract data
                 if (author_node, RDF.type, FOAF.Person) in graph:
@@ -412,7 +720,7 @@ class RDFParser:
             # If no numbered sequence found, try alternative approaches
             if not authors:
                 # Look for any objects of the sequence that are persons
-                for _, _, obj in graph.triples((authors_seq, None, None)):
+                for obj in objects:
                     if isinstance(obj, URIRef) and (obj, RDF.type, FOAF.Person) in graph:
                         author_data = self._extract_author_data(graph, obj)
                         if author_data:
@@ -426,8 +734,14 @@ class RDFParser:
     def _extract_author_data(self, graph: Graph, author_node: URIRef) -> Optional[Dict[str, str]]:
         """Extract data for a single author."""
         try:
-            given_name = graph.value(author_node, FOAF.givenName)
-            surname = graph.value(author_node, FOAF.surname)
+            # One sweep over the author's triples instead of a lookup per property
+            names: Dict[str, Any] = {}
+            for predicate, obj in graph.predicate_objects(author_node):
+                field = _AUTHOR_PREDICATE_FIELDS.get(predicate)
+                if field is not None and field not in names:
+                    names[field] = obj
+            given_name = names.get("given_name")
+            surname = names.get("surname")
             
             if given_name or surname:
                 given_str = str(given_name) if given_name else ""
@@ -449,24 +763,44 @@ class RDFParser:
     
     def _extract_venue(self, graph: Graph, subject: URIRef) -> str:
         """Extract venue/journal information."""
+        try:
+            part_of = graph.value(subject, DCTERMS.isPartOf)
+            publisher = graph.value(subject, DC.publisher)
+        except Exception as e:
+            self.logger.warning(f"Failed to extract venue: {str(e)}")
+            return ""
+        
+        return self._resolve_venue(graph, part_of, publisher)
+    
+    def _resolve_venue(self, graph: Graph, part_of: Optional[Any], publisher: Optional[Any]) -> str:
+        """Return the venue name from an item's dcterms:isPartOf and dc:publisher nodes."""
         venue = ""
+        venue_cache = self._venue_cache
+        publisher_cache = self._publisher_cache
         
         try:
             # Check for dcterms:isPartOf relationship
-            part_of = graph.value(subject, DCTERMS.isPartOf)
             if part_of:
                 # Get the title of the journal/venue
-                venue_title = graph.value(part_of, DC.title)
-                if venue_title:
-                    venue = str(venue_title)
+                if venue_cache is not None and part_of in venue_cache:
+                    venue = venue_cache[part_of]
+                else:
+                    venue_title = graph.value(part_of, DC.title)
+                    if venue_title:
+                        venue = str(venue_title)
+                    if venue_cache is not None:
+                        venue_cache[part_of] = venue
             
             # Also check for publisher information
-            if not venue:
-                publisher = graph.value(subject, DC.publisher)
-                if publisher:
+            if not venue and publisher:
+                if publisher_cache is not None and publisher in publisher_cache:
+                    venue = publisher_cache[publisher]
+                else:
                     publisher_name = graph.value(publisher, FOAF.name)
                     if publisher_name:
                         venue = str(publisher_name)
+                    if publisher_cache is not None:
+                        publisher_cache[publisher] = venue
         
         except Exception as e:
             self.logger.warning(f"Failed to extract venue: {str(e)}")
@@ -513,28 +847,14 @@ class RDFParser:
     
     def _extract_year_from_date(self, date_str: str) -> Optional[int]:
         """Extract year from a date string."""
-        try:
-            # Handle various date formats
-            if len(date_str) >= 4 and date_str[:4].isdigit():
-                return int(date_str[:4])
-        except (ValueError, TypeError):
-            pass
-        
-        return None
+        # isdecimal() admits exactly the digits int() accepts, so no
+        # exception handling is needed on the per-item path
+        head = date_str[:4]
+        return int(head) if len(head) == 4 and head.isdecimal() else None
     
     def _normalize_item_type(self, item_type: str) -> str:
         """Normalize item type to standard values."""
-        type_mapping = {
-            "journalArticle": "article",
-            "conferencePaper": "conference",
-            "book": "book",
-            "bookSection": "book",
-            "thesis": "thesis",
-            "report": "report",
-            "webpage": "webpage"
-        }
-        
-        return type_mapping.get(item_type, "other")
+        return _TYPE_MAPPING.get(item_type, "other")
     
     def _validate_parsed_graph(self, file_path: Path) -> None:
         """
@@ -553,23 +873,28 @@ class RDFParser:
         if len(self.graph) == 0:
             raise RDFValidationError(f"RDF file contains no triples: {file_path}")
         
-        # Check for minimum expected content
-        has_bibliography_items = False
-        has_zotero_namespaces = False
-        
-        # Look for bibliography-related triples
-        for s, p, o in self.graph:
-            predicate_str = str(p)
-            if str(BIB) in predicate_str or str(Z) in predicate_str or str(DC) in predicate_str:
-                has_zotero_namespaces = True
-            
-            # Check for bibliography item indicators
-            if (s, RDF.type, BIB.Article) in self.graph or \
-               (s, RDF.type, BIB.Book) in self.graph or \
-               any(self.graph.triples((None, BIB.authors, None))) or \
-               any(self.graph.triples((None, DC.title, None))):
-                has_bibliography_items = True
-                break
+        # Check for minimum expected content with index lookups that stop at
+        # the first match instead of iterating over the whole graph
+        has_bibliography_items = any(
+            next(self.graph.triples(pattern), None) is not None
+            for pattern in (
+                (None, RDF.type, BIB.Article),
+                (None, RDF.type, BIB.Book),
+                (None, BIB.authors, None),
+                (None, DC.title, None),
+            )
+        )
+        
+        # Predicates every Zotero export uses settle this without a scan; other
+        # graphs fall back to checking each predicate's namespace
+        zotero_prefixes = (str(BIB), str(Z), str(DC))
+        has_zotero_namespaces = any(
+            next(self.graph.triples((None, predicate, None)), None) is not None
+            for predicate in (DC.title, BIB.authors, Z.itemType)
+        ) or any(
+            str(predicate).startswith(zotero_prefixes)
+            for predicate in self.graph.predicates(unique=True)
+        )
         
         if not has_zotero_namespaces:
             self.logger.warning(f"RDF file may not be a Zotero export (no Zotero namespaces found): {file_path}")
@@ -595,56 +920,57 @@ class RDFParser:
             validation_issues.append("No bibliography items found")
             return validation_issues
         
-        required_fields = ["id", "title"]
-        recommended_fields = ["authors", "year", "type"]
-        
-        items_without_title = 0
-        items_without_authors = 0
-        items_without_year = 0
-        items_with_invalid_year = 0
+        counts = Counter()
         duplicate_ids = set()
         seen_ids = set()
         
         for i, item in enumerate(items_data):
-            item_id = item.get("id", f"item_{i}")
+            item_id = item.get("id")
+            title = item.get("title")
+            year = item.get("year")
+            authors = item.get("authors")
+            
+            # Check required fields
+            if not item_id:
+                if "id" not in item:
+                    item_id = f"item_{i}"
+                validation_issues.append(f"Item {item_id} missing required field: id")
             
             # Check for duplicate IDs
             if item_id in seen_ids:
                 duplicate_ids.add(item_id)
-            seen_ids.add(item_id)
+            else:
+                seen_ids.add(item_id)
             
-            # Check required fields
-            for field in required_fields:
-                if not item.get(field):
-                    if field == "title":
-                        items_without_title += 1
-                    validation_issues.append(f"Item {item_id} missing required field: {field}")
+            if not title:
+                counts["missing_title"] += 1
+                validation_issues.append(f"Item {item_id} missing required field: title")
             
             # Check recommended fields
-            if not item.get("authors"):
-                items_without_authors += 1
-            
-            if not item.get("year"):
-                items_without_year += 1
-            elif item.get("year"):
-                year = item["year"]
-                if not isinstance(year, int) or year < 1000 or year > 2100:
-                    items_with_invalid_year += 1
-                    validation_issues.append(f"Item {item_id} has invalid year: {year}")
+            if not year:
+                counts["missing_year"] += 1
+            elif not isinstance(year, int) or year < 1000 or year > 2100:
+                counts["invalid_year"] += 1
+                validation_issues.append(f"Item {item_id} has invalid year: {year}")
             
             # Validate author data structure
-            authors = item.get("authors", [])
-            if authors and not isinstance(authors, list):
+            if not authors:
+                counts["missing_authors"] += 1
+            elif not isinstance(authors, list):
                 validation_issues.append(f"Item {item_id} has invalid authors data structure")
             else:
                 for j, author in enumerate(authors):
                     if not isinstance(author, dict):
                         validation_issues.append(f"Item {item_id} author {j} is not a dictionary")
-                    elif not author.get("full_name") and not (author.get("given_name") or author.get("surname")):
+                    elif not (author.get("full_name") or author.get("given_name") or author.get("surname")):
                         validation_issues.append(f"Item {item_id} author {j} has no name information")
         
         # Summary statistics
         total_items = len(items_data)
+        items_without_title = counts["missing_title"]
+        items_without_authors = counts["missing_authors"]
+        items_without_year = counts["missing_year"]
+        items_with_invalid_year = counts["invalid_year"]
         
         if duplicate_ids:
             validation_issues.append(f"Found {len(duplicate_ids)} duplicate item IDs")
@@ -661,4 +987,4 @@ class RDFParser:
         if items_with_invalid_year > 0:
             validation_issues.append(f"{items_with_invalid_year}/{total_items} items have invalid years")
         
-        return validation_issues
\ No newline at end of file
+        return validation_issues
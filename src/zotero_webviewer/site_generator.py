@@ -1,217 +1,27 @@
 """Static site generation functionality."""
 
+import os
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union
+from dataclasses import astuple, dataclass
+
+from .file_utils import scan_files
 
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
     JINJA2_AVAILABLE = True
 except ImportError:
     JINJA2_AVAILABLE = False
 
-
-@dataclass
-class SiteConfig:
-    """Configuration for static site generation."""
-    title: str = "Literature Collection Webviewer"
-    collection_title: str = "Literature Collection"
-    description: str = "Interactive browser for academic literature collections exported from Zotero"
-    author: str = ""
-    base_url: str = ""
-    theme: str = "default"
-
-
-class SiteGenerationError(Exception):
-    """Exception raised when site generation fails."""
-    pass
+# Autoescape policy shared by every generator's environment
+_AUTOESCAPE = select_autoescape(['html', 'xml']) if JINJA2_AVAILABLE else None
 
 
-class SiteGenerator:
-    """Generates static HTML, CSS, and JavaScript files for the web interface."""
-    
-    def __init__(self, output_dir: str, templates_dir: str = "templates"):
-        self.output_dir = Path(output_dir)
-        self.templates_dir = Path(templates_dir)
-        self.logger = logging.getLogger(__name__)
-        
-        # Ensure Jinja2 is available
-        if not JINJA2_AVAILABLE:
-            raise SiteGenerationError(
-                "Static site generation requires the 'jinja2' package. "
-                "Install it with: pip install jinja2"
-            )
-        
-        # Initialize Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        self.jinja_env.filters['format_authors'] = self._format_authors
-        self.jinja_env.filters['truncate_text'] = self._truncate_text
-        self.jinja_env.filters['format_year'] = self._format_year
-    
-    def generate_site(self, config: Optional[SiteConfig] = None) -> List[str]:
-        """
-        Generate complete static website.
-        
-        Args:
-            config: Site configuration options
-            
-        Returns:
-            List of generated file paths
-            
-        Raises:
-            SiteGenerationError: If generation fails
-        """
-        if config is None:
-            config = SiteConfig()
-        
-        generated_files = []
-        
-        try:
-            self.logger.info("Starting static site generation")
-            
-            # Ensure output directory exists
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Generate HTML file
-            html_file = self._generate_html(config)
-            generated_files.append(html_file)
-            
-            # Copy CSS file
-            css_file = self._copy_css()
-            generated_files.append(css_file)
-            
-            # Copy JavaScript file
-            js_file = self._copy_javascript()
-            generated_files.append(js_file)
-            
-            # Create assets directory and copy any additional assets
-            assets_files = self._copy_assets()
-            generated_files.extend(assets_files)
-            
-            self.logger.info(f"Generated {len(generated_files)} static files")
-            return generated_files
-            
-        except Exception as e:
-            raise SiteGenerationError(f"Failed to generate static site: {str(e)}")
-    
-    def _generate_html(self, config: SiteConfig) -> str:
-        """Generate the main HTML file."""
-        try:
-            template = self.jinja_env.get_template('index.html')
-            
-            # Prepare template context
-            context = {
-                'title': config.title,
-                'collection_title': config.collection_title,
-                'description': config.description,
-                'author': config.author,
-                'base_url': config.base_url,
-                'theme': config.theme,
-            }
-            
-            # Render template
-            html_content = template.render(**context)
-            
-            # Write to output file
-            output_file = self.output_dir / 'index.html'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            self.logger.info(f"Generated HTML file: {output_file}")
-            return str(output_file)
-            
-        except Exception as e:
-            raise SiteGenerationError(f"Failed to generate HTML: {str(e)}")
-    
-    def _copy_css(self) -> str:
-        """Copy CSS file to output directory."""
-        try:
-            source_file = self.templates_dir / 'styles.css'
-            output_file = self.output_dir / 'styles.css'
-            
-            if source_file.exists():
-                shutil.copy2(source_file, output_file)
-                self.logger.info(f"Copied CSS file: {output_file}")
-            else:
-                # Generate basic CSS if template doesn't exist
-                self._generate_basic_css(output_file)
-                self.logger.warning(f"Template CSS not found, generated basic CSS: {output_file}")
-            
-            return str(output_file)
-            
-        except Exception as e:
-            raise SiteGenerationError(f"Failed to copy CSS: {str(e)}")
-    
-    def _copy_javascript(self) -> str:
-        """Copy JavaScript file to output directory."""
-        try:
-            source_file = self.templates_dir / 'app.js'
-            output_file = self.output_dir / 'app.js'
-            
-            if source_file.exists():
-                # Read the JavaScript file and add detailed item view functionality
-                with open(source_file, 'r', encoding='utf-8') as f:
-                    js_content = f.read()
-                
-                # Add detailed item view functionality if not already present
-                if 'const DetailedItemView' not in js_content:
-                    js_content += self._get_detailed_item_view_js()
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(js_content)
-                
-                self.logger.info(f"Generated JavaScript file: {output_file}")
-            else:
-                # Generate basic JavaScript if template doesn't exist
-                self._generate_basic_javascript(output_file)
-                self.logger.warning(f"Template JavaScript not found, generated basic JS: {output_file}")
-            
-            return str(output_file)
-            
-        except Exception as e:
-            raise SiteGenerationError(f"Failed to copy JavaScript: {str(e)}")
-    
-    def _copy_assets(self) -> List[str]:
-        """Copy additional assets to output directory."""
-        assets_files = []
-        
-        try:
-            # Create assets directory
-            assets_dir = self.output_dir / 'assets'
-            assets_dir.mkdir(exist_ok=True)
-            
-            # Copy any assets from templates/assets if it exists
-            template_assets_dir = self.templates_dir / 'assets'
-            if template_assets_dir.exists():
-                for asset_file in template_assets_dir.rglob('*'):
-                    if asset_file.is_file():
-                        relative_path = asset_file.relative_to(template_assets_dir)
-                        output_asset = assets_dir / relative_path
-                        output_asset.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(asset_file, output_asset)
-                        assets_files.append(str(output_asset))
-            
-            if assets_files:
-                self.logger.info(f"Copied {len(assets_files)} asset files")
-            
-            return assets_files
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to copy assets: {str(e)}")
-            return assets_files
-    
-    def _generate_basic_css(self, output_file: Path) -> None:
-        """Generate basic CSS if template is not available."""
-        basic_css = """
+# Fallback stylesheet written when the templates directory has no styles.css
+_BASIC_CSS = """
 /* Basic styles for literature webviewer */
 body {
     font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -310,58 +120,9 @@ body {
     cursor: pointer;
 }
 """
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(basic_css)
-    
-    def _generate_basic_javascript(self, output_file: Path) -> None:
-        """Generate basic JavaScript if template is not available."""
-        basic_js = """
-// Basic JavaScript for literature webviewer
-console.log('Literature Webviewer loaded');
-
-// Initialize when DOM is ready
-document.addEventListener('DOMContentLoaded', function() {
-    console.log('Initializing Literature Webviewer...');
-    
-    // Load data and initialize components
-    loadData().then(() => {
-        console.log('Data loaded successfully');
-    }).catch(error => {
-        console.error('Failed to load data:', error);
-    });
-});
-
-async function loadData() {
-    try {
-        const [bibliographyResponse, collectionsResponse] = await Promise.all([
-            fetch('data/bibliography.json'),
-            fetch('data/collections.json')
-        ]);
-        
-        const bibliography = await bibliographyResponse.json();
-        const collections = await collectionsResponse.json();
-        
-        // Initialize UI with data
-        initializeUI(bibliography, collections);
-        
-    } catch (error) {
-        throw new Error('Failed to load data: ' + error.message);
-    }
-}
 
-function initializeUI(bibliography, collections) {
-    // Basic UI initialization
-    console.log('UI initialized with', bibliography.items?.length || 0, 'items');
-}
-""" + self._get_detailed_item_view_js()
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(basic_js)
-    
-    def _get_detailed_item_view_js(self) -> str:
-        """Get JavaScript code for detailed item view functionality."""
-        return """
+# Detailed item view component appended to app.js unless already present
+_DETAILED_ITEM_VIEW_JS = """
 
 /**
  * Detailed Item View Component for displaying complete bibliography information
@@ -821,9 +582,13 @@ const DetailedItemView = {
      * Escape HTML characters
      */
     escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        if (text === null || text === undefined) return '';
+        return String(text)
+            .replace(/&/g, '&amp;')
+            .replace(/</g, '&lt;')
+            .replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;')
+            .replace(/'/g, '&#39;');
     }
 };
 
@@ -839,28 +604,394 @@ if (document.readyState === 'loading') {
     DetailedItemView.init();
 }
 """
+
+# Fallback script written when the templates directory has no app.js
+_BASIC_JS = """
+// Basic JavaScript for literature webviewer
+console.log('Literature Webviewer loaded');
+
+// Initialize when DOM is ready
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('Initializing Literature Webviewer...');
+    
+    // Load data and initialize components
+    loadData().then(() => {
+        console.log('Data loaded successfully');
+    }).catch(error => {
+        console.error('Failed to load data:', error);
+    });
+});
+
+async function loadData() {
+    try {
+        const [bibliographyResponse, collectionsResponse] = await Promise.all([
+            fetch('data/bibliography.json'),
+            fetch('data/collections.json')
+        ]);
+        
+        const bibliography = await bibliographyResponse.json();
+        const collections = await collectionsResponse.json();
+        
+        // Initialize UI with data
+        initializeUI(bibliography, collections);
+        
+    } catch (error) {
+        throw new Error('Failed to load data: ' + error.message);
+    }
+}
+
+function initializeUI(bibliography, collections) {
+    // Basic UI initialization
+    console.log('UI initialized with', bibliography.items?.length || 0, 'items');
+}
+""" + _DETAILED_ITEM_VIEW_JS
+
+# Encoded once so each build writes the fallback files without re-encoding
+_BASIC_CSS_BYTES = _BASIC_CSS.encode('utf-8')
+_BASIC_JS_BYTES = _BASIC_JS.encode('utf-8')
+_DETAILED_ITEM_VIEW_JS_BYTES = _DETAILED_ITEM_VIEW_JS.encode('utf-8')
+
+
+@dataclass
+class SiteConfig:
+    """Configuration for static site generation."""
+    title: str = "Literature Collection Webviewer"
+    collection_title: str = "Literature Collection"
+    description: str = "Interactive browser for academic literature collections exported from Zotero"
+    author: str = ""
+    base_url: str = ""
+    theme: str = "default"
+
+
+class SiteGenerationError(Exception):
+    """Exception raised when site generation fails."""
+    pass
+
+
+class SiteGenerator:
+    """Generates static HTML, CSS, and JavaScript files for the web interface."""
+    
+    def __init__(self, output_dir: str, templates_dir: str = "templates", cache_dir: Optional[str] = None):
+        """
+        Initialize the site generator.
+        
+        Args:
+            output_dir: Directory the site files are written to
+            templates_dir: Directory containing index.html, styles.css and app.js
+            cache_dir: Directory for caching compiled templates between runs
+                (disabled if None)
+        """
+        self.output_dir = Path(output_dir)
+        self.templates_dir = Path(templates_dir)
+        self.logger = logging.getLogger(__name__)
+        
+        # Ensure Jinja2 is available
+        if not JINJA2_AVAILABLE:
+            raise SiteGenerationError(
+                "Static site generation requires the 'jinja2' package. "
+                "Install it with: pip install jinja2"
+            )
+        
+        # Initialize Jinja2 environment. Templates do not change during a
+        # run, so loaded templates are not re-checked against their files.
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            autoescape=_AUTOESCAPE,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            bytecode_cache=self._create_bytecode_cache(cache_dir)
+        )
+        
+        # Add custom filters
+        self.jinja_env.filters['format_authors'] = SiteGenerator._format_authors
+        self.jinja_env.filters['truncate_text'] = SiteGenerator._truncate_text
+        self.jinja_env.filters['format_year'] = SiteGenerator._format_year
+        
+        # Compiled index.html template, loaded on first use
+        self._index_template = None
+        
+        # ((mtime_ns, size) of the template app.js, assembled app.js bytes)
+        self._app_js_cache = None
+        
+        # (SiteConfig values, rendered index.html bytes) of the last render
+        self._index_html_cache = None
+    
+    def _create_bytecode_cache(self, cache_dir: Optional[str]) -> Optional["FileSystemBytecodeCache"]:
+        """Return a bytecode cache in cache_dir, or None if caching is disabled or unavailable."""
+        if cache_dir is None:
+            return None
+        
+        # Entries are validated against a checksum of the template source,
+        # so edited templates are recompiled rather than served stale
+        bytecode_dir = Path(cache_dir) / "jinja"
+        try:
+            bytecode_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Template bytecode cache disabled: {str(e)}")
+            return None
+        
+        return FileSystemBytecodeCache(str(bytecode_dir))
+    
+    def generate_site(self, config: Optional[SiteConfig] = None) -> List[str]:
+        """
+        Generate complete static website.
+        
+        Args:
+            config: Site configuration options
+            
+        Returns:
+            List of generated file paths
+            
+        Raises:
+            SiteGenerationError: If generation fails
+        """
+        if config is None:
+            config = SiteConfig()
+        
+        generated_files = []
+        
+        try:
+            self.logger.info("Starting static site generation")
+            
+            # Ensure output directory exists
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Generate HTML file
+            html_file = self._generate_html(config)
+            generated_files.append(html_file)
+            
+            # Copy CSS file
+            css_file = self._copy_css()
+            generated_files.append(css_file)
+            
+            # Copy JavaScript file
+            js_file = self._copy_javascript()
+            generated_files.append(js_file)
+            
+            # Create assets directory and copy any additional assets
+            assets_files = self._copy_assets()
+            generated_files.extend(assets_files)
+            
+            self.logger.info(f"Generated {len(generated_files)} static files")
+            return generated_files
+            
+        except Exception as e:
+            raise SiteGenerationError(f"Failed to generate static site: {str(e)}")
+    
+    def _generate_html(self, config: SiteConfig) -> str:
+        """Generate the main HTML file."""
+        try:
+            # The page depends only on the config, so reuse the last render
+            # while the config is unchanged
+            config_key = astuple(config)
+            if self._index_html_cache is not None and self._index_html_cache[0] == config_key:
+                html_bytes = self._index_html_cache[1]
+            else:
+                if self._index_template is None:
+                    self._index_template = self.jinja_env.get_template('index.html')
+                template = self._index_template
+                
+                # Prepare template context
+                context = {
+                    'title': config.title,
+                    'collection_title': config.collection_title,
+                    'description': config.description,
+                    'author': config.author,
+                    'base_url': config.base_url,
+                    'theme': config.theme,
+                }
+                
+                # Render template
+                html_bytes = template.render(**context).encode('utf-8')
+                self._index_html_cache = (config_key, html_bytes)
+            
+            # Write to output file
+            output_file = self.output_dir / 'index.html'
+            if self._write_if_changed(output_file, html_bytes):
+                self.logger.info(f"Generated HTML file: {output_file}")
+            return str(output_file)
+            
+        except Exception as e:
+            raise SiteGenerationError(f"Failed to generate HTML: {str(e)}")
     
-    def _format_authors(self, authors: List[Dict[str, Any]]) -> str:
+    def _copy_css(self) -> str:
+        """Copy CSS file to output directory."""
+        try:
+            source_file = self.templates_dir / 'styles.css'
+            output_file = self.output_dir / 'styles.css'
+            
+            if source_file.exists():
+                if self._copy_if_changed(source_file, output_file):
+                    self.logger.info(f"Copied CSS file: {output_file}")
+            else:
+                # Generate basic CSS if template doesn't exist
+                self._generate_basic_css(output_file)
+                self.logger.warning(f"Template CSS not found, generated basic CSS: {output_file}")
+            
+            return str(output_file)
+            
+        except Exception as e:
+            raise SiteGenerationError(f"Failed to copy CSS: {str(e)}")
+    
+    def _copy_javascript(self) -> str:
+        """Copy JavaScript file to output directory."""
+        try:
+            source_file = self.templates_dir / 'app.js'
+            output_file = self.output_dir / 'app.js'
+            
+            try:
+                source_stat = source_file.stat()
+            except FileNotFoundError:
+                source_stat = None
+            
+            if source_stat is not None:
+                # Reuse the assembled script while the template is unchanged
+                source_key = (source_stat.st_mtime_ns, source_stat.st_size)
+                if self._app_js_cache is not None and self._app_js_cache[0] == source_key:
+                    js_bytes = self._app_js_cache[1]
+                else:
+                    js_bytes = self._assemble_javascript(source_file)
+                    self._app_js_cache = (source_key, js_bytes)
+                
+                if self._write_if_changed(output_file, js_bytes):
+                    self.logger.info(f"Generated JavaScript file: {output_file}")
+            else:
+                # Generate basic JavaScript if template doesn't exist
+                self._generate_basic_javascript(output_file)
+                self.logger.warning(f"Template JavaScript not found, generated basic JS: {output_file}")
+            
+            return str(output_file)
+            
+        except Exception as e:
+            raise SiteGenerationError(f"Failed to copy JavaScript: {str(e)}")
+    
+    def _assemble_javascript(self, source_file: Path) -> bytes:
+        """Return the template JavaScript with the detailed item view appended if missing."""
+        # The script is passed through as-is, so it never needs decoding
+        js_bytes = source_file.read_bytes()
+        if b'const DetailedItemView' not in js_bytes:
+            js_bytes += _DETAILED_ITEM_VIEW_JS_BYTES
+        return js_bytes
+    
+    def _copy_assets(self) -> List[str]:
+        """Copy additional assets to output directory."""
+        assets_files = []
+        
+        try:
+            # Create assets directory
+            assets_dir = self.output_dir / 'assets'
+            assets_dir.mkdir(exist_ok=True)
+            
+            # Copy any assets from templates/assets if it exists
+            template_assets_dir = self.templates_dir / 'assets'
+            if template_assets_dir.exists():
+                # Walk with scandir and plain string paths; directory entries
+                # already know their type, so no per-file stat or Path objects
+                source_root = str(template_assets_dir)
+                output_root = str(assets_dir)
+                copies = []
+                output_dirs = set()
+                for entry in scan_files(source_root):
+                    output_asset = os.path.join(output_root, entry.path[len(source_root) + 1:])
+                    copies.append((entry.path, output_asset))
+                    output_dirs.add(os.path.dirname(output_asset))
+                
+                # Create each output directory once rather than once per file
+                for output_dir in sorted(output_dirs):
+                    os.makedirs(output_dir, exist_ok=True)
+                
+                # Copying is I/O bound and shutil releases the GIL in its
+                # syscalls, so threads copy several assets at once; a pool is
+                # not worth starting for a handful of files
+                if len(copies) >= 4:
+                    max_workers = min(32, (os.cpu_count() or 1) * 4, len(copies))
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        list(executor.map(lambda pair: self._copy_if_changed(*pair), copies))
+                else:
+                    for asset_file, output_asset in copies:
+                        self._copy_if_changed(asset_file, output_asset)
+                assets_files.extend(output_asset for _, output_asset in copies)
+            
+            if assets_files:
+                self.logger.info(f"Copied {len(assets_files)} asset files")
+            
+            return assets_files
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to copy assets: {str(e)}")
+            return assets_files
+    
+    def _write_if_changed(self, output_file: Path, data: bytes) -> bool:
+        """Write data unless the file already holds it; return True if written."""
+        # Leaving unchanged files untouched keeps their modification times, so
+        # precompressed copies and deployment syncs stay valid across rebuilds
+        try:
+            if output_file.stat().st_size == len(data) and output_file.read_bytes() == data:
+                self.logger.debug(f"Skipping unchanged file: {output_file}")
+                return False
+        except FileNotFoundError:
+            pass
+        
+        output_file.write_bytes(data)
+        return True
+    
+    def _copy_if_changed(self, source_file: Union[str, Path], output_file: Union[str, Path]) -> bool:
+        """Copy source_file unless the output is an unmodified earlier copy; return True if copied."""
+        # Copies take over the source's modification time, so matching size
+        # and mtime mean neither file has changed since the last copy
+        source_stat = os.stat(source_file)
+        try:
+            output_stat = os.stat(output_file)
+            if (output_stat.st_size == source_stat.st_size
+                    and output_stat.st_mtime_ns == source_stat.st_mtime_ns):
+                self.logger.debug(f"Skipping unchanged file: {output_file}")
+                return False
+        except FileNotFoundError:
+            pass
+        
+        # copyfile uses sendfile where available; only the timestamps are
+        # carried over, skipping copy2's permission and xattr syscalls
+        shutil.copyfile(source_file, output_file)
+        os.utime(output_file, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        return True
+    
+    def _generate_basic_css(self, output_file: Path) -> None:
+        """Generate basic CSS if template is not available."""
+        self._write_if_changed(output_file, _BASIC_CSS_BYTES)
+    
+    def _generate_basic_javascript(self, output_file: Path) -> None:
+        """Generate basic JavaScript if template is not available."""
+        self._write_if_changed(output_file, _BASIC_JS_BYTES)
+    
+    def _get_detailed_item_view_js(self) -> str:
+        """Get JavaScript code for detailed item view functionality."""
+        return _DETAILED_ITEM_VIEW_JS
+    
+    @staticmethod
+    def _format_authors(authors: List[Dict[str, Any]]) -> str:
         """Jinja2 filter to format authors list."""
         if not authors:
             return "Unknown authors"
         
-        author_names = []
-        for author in authors:
-            if isinstance(author, dict):
-                name = author.get('fullName') or f"{author.get('givenName', '')} {author.get('surname', '')}".strip()
-                if name:
-                    author_names.append(name)
+        names = (
+            author.get('fullName') or f"{author.get('givenName', '')} {author.get('surname', '')}".strip()
+            for author in authors
+            if isinstance(author, dict)
+        )
+        author_names = [name for name in names if name]
         
         return ", ".join(author_names) if author_names else "Unknown authors"
     
-    def _truncate_text(self, text: str, length: int = 100) -> str:
+    @staticmethod
+    def _truncate_text(text: str, length: int = 100) -> str:
         """Jinja2 filter to truncate text."""
         if not text or len(text) <= length:
             return text
         return text[:length].rsplit(' ', 1)[0] + '...'
     
-    def _format_year(self, year: Any) -> str:
+    @staticmethod
+    def _format_year(year: Any) -> str:
         """Jinja2 filter to format year."""
         if not year:
             return "Unknown"
@@ -877,18 +1008,19 @@ if (document.readyState === 'loading') {
         
         for file_name in ['index.html', 'styles.css', 'app.js']:
             file_path = self.output_dir / file_name
-            if file_path.exists():
+            try:
                 stat = file_path.stat()
+            except FileNotFoundError:
                 files_info[file_name] = {
                     'path': str(file_path),
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime,
-                    'exists': True
+                    'exists': False
                 }
             else:
                 files_info[file_name] = {
                     'path': str(file_path),
-                    'exists': False
+                    'size': stat.st_size,
+                    'modified': stat.st_mtime,
+                    'exists': True
                 }
         
         return files_info
\ No newline at end of file
@@ -1,9 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
-import tempfile
 import shutil
-from pathlib import Path
 from rdflib import Graph, Namespace, URIRef, Literal
 from rdflib.namespace import RDF, DC, DCTERMS, FOAF
 
@@ -19,16 +17,14 @@ PRISM = Namespace("http://prismstandard.org/namespaces/1.2/basic/")
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for test files."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+    # pytest prunes old tmp_path trees itself, so no rmtree per test
+    return tmp_path
 
 
-@pytest.fixture
-def sample_rdf_data():
-    """Create sample RDF data for testing."""
+def _build_sample_rdf_graph():
+    """Build the sample Zotero-style RDF graph used by the RDF fixtures."""
     graph = Graph()
     
     # Bind namespaces
@@ -102,11 +98,33 @@ def sample_rdf_data():
     return graph
 
 
+@pytest.fixture(scope="session")
+def sample_rdf_graph():
+    """Sample RDF graph built once per session; tests must not modify it."""
+    return _build_sample_rdf_graph()
+
+
+@pytest.fixture
+def sample_rdf_data():
+    """Create sample RDF data for testing."""
+    # Tests add triples to this graph, so each one gets its own
+    return _build_sample_rdf_graph()
+
+
+@pytest.fixture(scope="session")
+def sample_rdf_source(tmp_path_factory, sample_rdf_graph):
+    """Serialize the sample graph once per session; copied by sample_rdf_file."""
+    rdf_file = tmp_path_factory.mktemp("rdfcache") / "sample.rdf"
+    sample_rdf_graph.serialize(destination=str(rdf_file), format="xml")
+    return rdf_file
+
+
 @pytest.fixture
-def sample_rdf_file(temp_dir, sample_rdf_data):
+def sample_rdf_file(temp_dir, sample_rdf_source):
     """Create a sample RDF file for testing."""
+    # A private copy, since tests append to the file and bump its mtime
     rdf_file = temp_dir / "sample.rdf"
-    sample_rdf_data.serialize(destination=str(rdf_file), format="xml")
+    shutil.copyfile(sample_rdf_source, rdf_file)
     return str(rdf_file)
 
 
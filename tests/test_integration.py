@@ -1,12 +1,15 @@
 """Integration tests for the complete RDF-to-website build pipeline."""
 
+import os
+import shutil
 import pytest
 import json
+import hashlib
 from pathlib import Path
 from rdflib import Graph, Namespace, URIRef, Literal
 from rdflib.namespace import RDF, DC, DCTERMS, FOAF
 
-from zotero_webviewer.build_pipeline import BuildPipeline, BuildConfig
+from zotero_webviewer.build_pipeline import BuildPipeline, BuildConfig, BuildPipelineError
 from zotero_webviewer.rdf_parser import RDFParser
 from zotero_webviewer.data_transformer import DataTransformer
 from zotero_webviewer.collection_builder import CollectionHierarchyBuilder
@@ -191,6 +194,48 @@ class TestBuildPipelineIntegration:
         
         assert research_found
     
+    def test_site_generation_overlaps_json_generation(self, temp_dir, sample_rdf_file, mocker):
+        """Test that static site files are generated on a worker thread."""
+        import threading
+        
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "output"))
+        pipeline = BuildPipeline(config)
+        
+        thread_names = []
+        original_generate_site = pipeline.site_generator.generate_site
+        
+        def record_thread(site_config):
+            thread_names.append(threading.current_thread().name)
+            return original_generate_site(site_config)
+        
+        mocker.patch.object(pipeline.site_generator, "generate_site", side_effect=record_thread)
+        result = pipeline.build()
+        pipeline.cleanup()
+        
+        assert result.success is True
+        assert len(thread_names) == 1
+        assert thread_names[0] != threading.main_thread().name
+        assert any(f.endswith("index.html") for f in result.files_generated)
+    
+    def test_production_build_creates_deployment_files(self, temp_dir, sample_rdf_file):
+        """Test that a production build optimizes output and writes deployment files."""
+        output_dir = temp_dir / "output"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir), production=True)
+        pipeline = BuildPipeline(config)
+        result = pipeline.build()
+        pipeline.cleanup()
+        
+        assert result.success is True
+        assert (output_dir / ".nojekyll").exists()
+        assert (output_dir / "index.html.gz").exists()
+        assert not any(w.startswith("Deployment validation") for w in result.warnings)
+        assert not any(w.startswith("Production optimization failed") for w in result.warnings)
+        
+        with open(output_dir / "deployment-info.json", encoding="utf-8") as f:
+            deployment_info = json.load(f)
+        listed = {entry["path"] for entry in deployment_info["files"]}
+        assert "index.html.gz" in listed
+    
     def test_pipeline_error_handling_invalid_rdf(self, temp_dir):
         """Test pipeline error handling with invalid RDF file."""
         # Create invalid RDF file
@@ -229,6 +274,17 @@ class TestBuildPipelineIntegration:
             # Exception is also acceptable for missing file
             pass
     
+    def test_pipeline_rejects_directory_input(self, temp_dir):
+        """Test that a directory passed as input file fails input validation."""
+        config = BuildConfig(
+            input_file=str(temp_dir),
+            output_dir=str(temp_dir / "output")
+        )
+        pipeline = BuildPipeline(config)
+        
+        with pytest.raises(BuildPipelineError, match="not a file"):
+            pipeline.build()
+    
     def test_pipeline_with_large_dataset(self, temp_dir):
         """Test pipeline performance with larger dataset."""
         # Create RDF with many items (100 items, 10 collections)
@@ -448,6 +504,110 @@ class TestComponentIntegration:
             js_content = js_file.read_text(encoding='utf-8')
             # Data file references should be in JavaScript
             assert "bibliography.json" in js_content or "collections.json" in js_content
+    
+    def test_site_generator_reuses_index_template(self, temp_dir, mocker):
+        """Test that repeated site generation loads index.html only once."""
+        site_generator = SiteGenerator(str(temp_dir))
+        get_template_spy = mocker.spy(site_generator.jinja_env, "get_template")
+        
+        site_generator.generate_site()
+        site_generator.generate_site()
+        
+        assert get_template_spy.call_count == 1
+        assert "<html" in (temp_dir / "index.html").read_text(encoding='utf-8')
+    
+    def test_site_generator_renders_index_once_per_config(self, temp_dir, mocker):
+        """Test that index.html is only re-rendered when the site config changes."""
+        from jinja2 import Template
+        from zotero_webviewer.site_generator import SiteConfig
+        site_generator = SiteGenerator(str(temp_dir))
+        render_spy = mocker.spy(Template, "render")
+        
+        site_generator.generate_site(SiteConfig(title="First"))
+        site_generator.generate_site(SiteConfig(title="First"))
+        assert render_spy.call_count == 1
+        
+        site_generator.generate_site(SiteConfig(title="Second"))
+        
+        assert render_spy.call_count == 2
+        assert "Second" in (temp_dir / "index.html").read_text(encoding='utf-8')
+    
+    def test_site_generator_bytecode_cache(self, temp_dir, mocker):
+        """Test that compiled templates are reused by later generators sharing a cache dir."""
+        cache_dir = temp_dir / "cache"
+        SiteGenerator(str(temp_dir / "first"), cache_dir=str(cache_dir)).generate_site()
+        assert len(list((cache_dir / "jinja").iterdir())) == 1
+        
+        site_generator = SiteGenerator(str(temp_dir / "second"), cache_dir=str(cache_dir))
+        compile_spy = mocker.spy(site_generator.jinja_env, "compile")
+        site_generator.generate_site()
+        
+        assert compile_spy.call_count == 0
+        assert (temp_dir / "second" / "index.html").read_bytes() == (temp_dir / "first" / "index.html").read_bytes()
+    
+    def test_site_generator_skips_unchanged_outputs(self, temp_dir):
+        """Test that regenerating the site leaves unchanged files untouched."""
+        templates_dir = temp_dir / "templates"
+        shutil.copytree("templates", templates_dir)
+        site_generator = SiteGenerator(str(temp_dir / "site"), templates_dir=str(templates_dir))
+        files = [Path(path) for path in site_generator.generate_site()]
+        mtimes = {path: path.stat().st_mtime_ns - 1_000_000_000 for path in files}
+        for path, mtime in mtimes.items():
+            os.utime(path, ns=(mtime, mtime))
+        
+        # Simulate the production optimizer minifying styles.css in place
+        (temp_dir / "site" / "styles.css").write_text("body{}", encoding='utf-8')
+        site_generator.generate_site()
+        
+        assert (temp_dir / "site" / "index.html").stat().st_mtime_ns == mtimes[temp_dir / "site" / "index.html"]
+        assert (temp_dir / "site" / "app.js").stat().st_mtime_ns == mtimes[temp_dir / "site" / "app.js"]
+        assert (temp_dir / "site" / "styles.css").read_bytes() == (templates_dir / "styles.css").read_bytes()
+    
+    def test_site_generator_copies_nested_assets(self, temp_dir):
+        """Test that assets in nested template directories are copied."""
+        templates_dir = temp_dir / "templates"
+        shutil.copytree("templates", templates_dir)
+        for relative_path in ("logo.svg", "img/a.png", "img/icons/b.png", "fonts/c.woff2"):
+            asset = templates_dir / "assets" / relative_path
+            asset.parent.mkdir(parents=True, exist_ok=True)
+            asset.write_bytes(relative_path.encode())
+        
+        files = SiteGenerator(str(temp_dir / "site"), templates_dir=str(templates_dir)).generate_site()
+        
+        for relative_path in ("logo.svg", "img/a.png", "img/icons/b.png", "fonts/c.woff2"):
+            output_asset = temp_dir / "site" / "assets" / relative_path
+            assert str(output_asset) in files
+            assert output_asset.read_bytes() == relative_path.encode()
+    
+    def test_site_generator_reuses_assembled_javascript(self, temp_dir, mocker):
+        """Test that app.js is only re-read when its template changes."""
+        templates_dir = temp_dir / "templates"
+        shutil.copytree("templates", templates_dir)
+        site_generator = SiteGenerator(str(temp_dir / "site"), templates_dir=str(templates_dir))
+        assemble_spy = mocker.spy(site_generator, "_assemble_javascript")
+        
+        site_generator.generate_site()
+        site_generator.generate_site()
+        assert assemble_spy.call_count == 1
+        
+        with open(templates_dir / "app.js", "a", encoding="utf-8") as f:
+            f.write("\n// changed\n")
+        site_generator.generate_site()
+        
+        assert assemble_spy.call_count == 2
+        assert "// changed" in (temp_dir / "site" / "app.js").read_text(encoding="utf-8")
+    
+    def test_site_generator_files_info(self, temp_dir):
+        """Test that generated file info reports sizes and missing files."""
+        site_generator = SiteGenerator(str(temp_dir))
+        site_generator.generate_site()
+        (temp_dir / "app.js").unlink()
+        
+        files_info = site_generator.get_generated_files_info()
+        
+        assert files_info["index.html"]["exists"] is True
+        assert files_info["index.html"]["size"] == (temp_dir / "index.html").stat().st_size
+        assert files_info["app.js"] == {"path": str(temp_dir / "app.js"), "exists": False}
 
 
 class TestEndToEndScenarios:
@@ -677,6 +837,354 @@ class TestEndToEndScenarios:
         # Should now have complete website
         assert (output_dir / "index.html").exists()
         assert (output_dir / "data" / "bibliography.json").exists()
+    
+    def test_validate_rdf_reuses_cached_parse(self, temp_dir, sample_rdf_file, monkeypatch, mocker):
+        """Test that validate-rdf --cache serves a repeated run from the parse cache."""
+        from click.testing import CliRunner
+        from zotero_webviewer.cli import cli
+        
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+        runner = CliRunner()
+        first = runner.invoke(cli, ["validate-rdf", "--input", sample_rdf_file, "--cache"])
+        parse_spy = mocker.spy(Graph, "parse")
+        
+        second = runner.invoke(cli, ["validate-rdf", "--input", sample_rdf_file, "--cache"])
+        
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        assert second.output == first.output
+        assert parse_spy.call_count == 0
+        assert list((temp_dir / "cache" / "zotero-webviewer").glob("*.pkl"))
+
+
+class TestIncrementalBuildDetection:
+    """Tests for input change detection used by incremental builds."""
+    
+    def test_input_hash_reused_when_file_unchanged(self, temp_dir, sample_rdf_file, mocker):
+        """Test that an unchanged file is not re-hashed."""
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website"))
+        pipeline = BuildPipeline(config)
+        
+        first_hash = pipeline._calculate_input_hash()
+        hash_spy = mocker.spy(hashlib, "blake2b")
+        
+        assert pipeline._calculate_input_hash() == first_hash
+        assert hash_spy.call_count == 0
+    
+    def test_input_hash_changes_with_content(self, temp_dir, sample_rdf_file):
+        """Test that modifying the input file changes its hash."""
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website"))
+        pipeline = BuildPipeline(config)
+        
+        first_hash = pipeline._calculate_input_hash()
+        with open(sample_rdf_file, "a") as f:
+            f.write("\n")
+        
+        assert first_hash
+        assert pipeline._calculate_input_hash() != first_hash
+    
+    def test_input_hash_matches_full_file_digest(self, temp_dir, sample_rdf_file):
+        """Test that the input hash is the BLAKE2b digest of the file contents."""
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website"))
+        pipeline = BuildPipeline(config)
+        
+        expected = hashlib.blake2b(Path(sample_rdf_file).read_bytes(), digest_size=16).hexdigest()
+        
+        assert pipeline._calculate_input_hash() == expected
+    
+    def test_input_hash_of_empty_file(self, temp_dir):
+        """Test that an empty input file can be hashed."""
+        empty_file = temp_dir / "empty.rdf"
+        empty_file.write_bytes(b"")
+        pipeline = BuildPipeline(BuildConfig(input_file=str(empty_file), output_dir=str(temp_dir / "website")))
+        
+        assert pipeline._calculate_input_hash() == hashlib.blake2b(b"", digest_size=16).hexdigest()
+    
+    def test_build_state_persists_across_pipelines(self, temp_dir, sample_rdf_file, mocker):
+        """Test that a new pipeline skips the build when nothing changed."""
+        output_dir = temp_dir / "website"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))
+        
+        result1 = BuildPipeline(config).build()
+        assert (output_dir / ".build-cache.json").exists()
+        
+        pipeline = BuildPipeline(config)
+        parse_spy = mocker.spy(pipeline.parser, "parse_rdf_file")
+        result2 = pipeline.build()
+        
+        assert parse_spy.call_count == 0
+        assert result2.success is True
+        assert result2.items_count == result1.items_count
+        assert result2.files_generated == result1.files_generated
+    
+    def test_restored_build_counts_in_statistics(self, temp_dir, sample_rdf_file):
+        """Test that a build restored from the cache is reflected in the statistics."""
+        output_dir = temp_dir / "website"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))
+        result = BuildPipeline(config).build()
+        
+        pipeline = BuildPipeline(config)
+        stats = pipeline.get_build_statistics()
+        
+        assert len(pipeline._build_history) == 1
+        assert stats["total_builds"] == 1
+        assert stats["successful_builds"] == 1
+        assert stats["last_successful_build"] == result.timestamp.isoformat()
+    
+    def test_build_state_ignored_when_config_changes(self, temp_dir, sample_rdf_file, mocker):
+        """Test that a different build configuration triggers a rebuild."""
+        output_dir = temp_dir / "website"
+        BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))).build()
+        
+        pipeline = BuildPipeline(BuildConfig(
+            input_file=sample_rdf_file,
+            output_dir=str(output_dir),
+            combined_json=True
+        ))
+        parse_spy = mocker.spy(pipeline.parser, "parse_rdf_file")
+        pipeline.build()
+        
+        assert parse_spy.call_count == 1
+    
+    def test_build_state_ignored_when_templates_change(self, temp_dir, sample_rdf_file, monkeypatch):
+        """Test that editing a template rebuilds the site in a new pipeline."""
+        shutil.copytree(Path(__file__).parent.parent / "templates", temp_dir / "templates")
+        monkeypatch.chdir(temp_dir)
+        output_dir = temp_dir / "website"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))
+        BuildPipeline(config).build()
+        
+        styles = temp_dir / "templates" / "styles.css"
+        styles.write_text(styles.read_text(encoding="utf-8") + "\n.changed { color: red; }\n", encoding="utf-8")
+        BuildPipeline(config).build()
+        
+        assert ".changed" in (output_dir / "styles.css").read_text(encoding="utf-8")
+    
+    def test_build_state_stores_paths_relative_to_output(self, temp_dir, sample_rdf_file, monkeypatch):
+        """Test that the persisted file list does not depend on the working directory."""
+        output_dir = temp_dir / "website"
+        result = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))).build()
+        
+        cache = json.loads((output_dir / ".build-cache.json").read_text(encoding="utf-8"))
+        assert os.path.join("data", "bibliography.json") in cache["files"]
+        assert not any(os.path.isabs(file_path) for file_path in cache["files"])
+        
+        monkeypatch.chdir(temp_dir)
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir="website"))
+        assert len(pipeline._build_history) == 1
+        assert len(pipeline._build_history[-1].files_generated) == len(result.files_generated)
+    
+    def test_build_state_ignored_when_output_missing(self, temp_dir, sample_rdf_file, mocker):
+        """Test that deleted output files trigger a rebuild."""
+        output_dir = temp_dir / "website"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))
+        BuildPipeline(config).build()
+        (output_dir / "index.html").unlink()
+        
+        pipeline = BuildPipeline(config)
+        parse_spy = mocker.spy(pipeline.parser, "parse_rdf_file")
+        pipeline.build()
+        
+        assert parse_spy.call_count == 1
+        assert (output_dir / "index.html").exists()
+    
+    def test_unchanged_json_outputs_are_not_rewritten(self, temp_dir, sample_rdf_file, mocker):
+        """Test that a rebuild with identical extracted data skips JSON generation."""
+        output_dir = temp_dir / "website"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))
+        BuildPipeline(config).build()
+        data_files = [output_dir / "data" / name for name in ("bibliography.json", "collections.json", "search_index.json")]
+        mtimes = {path: path.stat().st_mtime_ns for path in data_files}
+        
+        # Change the file without changing its data
+        with open(sample_rdf_file, "a") as f:
+            f.write("\n")
+        
+        pipeline = BuildPipeline(config)
+        items_spy = mocker.spy(pipeline.json_generator, "generate_item_files")
+        col_spy = mocker.spy(pipeline.json_generator, "generate_collections_json")
+        result = pipeline.build()
+        
+        assert result.success is True
+        assert items_spy.call_args.kwargs["bibliography_filename"] is None
+        assert items_spy.call_args.kwargs["search_index_filename"] is None
+        assert col_spy.call_count == 0
+        assert {path: path.stat().st_mtime_ns for path in data_files} == mtimes
+        assert str(output_dir / "data" / "bibliography.json") in result.files_generated
+        assert (output_dir / "data" / "bibliography.json").exists()
+    
+    def test_validate_output_reports_missing_empty_and_invalid_files(self, temp_dir, sample_rdf_file):
+        """Test that output validation reports each kind of broken file."""
+        from zotero_webviewer.build_pipeline import BuildValidationError
+        
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        empty_file = temp_dir / "empty.json"
+        empty_file.write_text("")
+        invalid_file = temp_dir / "invalid.json"
+        invalid_file.write_text("{not json")
+        valid_file = temp_dir / "valid.json"
+        valid_file.write_text('{"items": []}')
+        
+        with pytest.raises(BuildValidationError) as exc_info:
+            pipeline._validate_output([
+                str(temp_dir / "missing.json"),
+                str(empty_file),
+                str(invalid_file),
+                str(valid_file)
+            ])
+        
+        message = str(exc_info.value)
+        assert "Expected file not found" in message
+        assert "Empty file generated" in message
+        assert "Invalid JSON file" in message
+        assert "valid.json" not in message.replace("invalid.json", "")
+    
+    def test_validate_output_skips_parsing_written_json(self, temp_dir, sample_rdf_file, mocker):
+        """Test that only JSON files not written in this build are parsed again."""
+        from zotero_webviewer import build_pipeline
+        
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        written_file = temp_dir / "data.json"
+        written_file.write_text('{"items": []}')
+        kept_file = temp_dir / "kept.json"
+        kept_file.write_text('{"items": []}')
+        
+        load_spy = mocker.spy(build_pipeline, "load_json_bytes")
+        pipeline._validate_output([str(written_file), str(kept_file)], written_json={str(written_file)})
+        
+        assert load_spy.call_count == 1
+    
+    def test_kept_json_outputs_are_validated(self, temp_dir, sample_rdf_file):
+        """Test that a JSON file kept from an earlier build is still checked."""
+        output_dir = temp_dir / "website"
+        config = BuildConfig(input_file=sample_rdf_file, output_dir=str(output_dir))
+        BuildPipeline(config).build()
+        (output_dir / "data" / "collections.json").write_text("{broken")
+        
+        # Change the file without changing its data, so no JSON is rewritten
+        with open(sample_rdf_file, "a") as f:
+            f.write("\n")
+        result = BuildPipeline(config).build()
+        
+        assert any("Invalid JSON file" in warning and "collections.json" in warning for warning in result.warnings)
+    
+    def test_watch_filter_matches_only_input_file(self, temp_dir, sample_rdf_file):
+        """Test that watch mode only reacts to changes of the input file."""
+        watchfiles = pytest.importorskip("watchfiles")
+        
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        pipeline._watch_target = Path(sample_rdf_file).resolve()
+        pipeline._watch_path = os.path.abspath(sample_rdf_file)
+        pipeline._watch_names = {Path(sample_rdf_file).name}
+        
+        assert pipeline._is_input_change(watchfiles.Change.modified, sample_rdf_file)
+        assert pipeline._is_input_change(watchfiles.Change.added, sample_rdf_file)
+        assert not pipeline._is_input_change(watchfiles.Change.deleted, sample_rdf_file)
+        assert not pipeline._is_input_change(watchfiles.Change.modified, str(temp_dir / "other.rdf"))
+    
+    def test_wait_for_stable_input_returns_once_unchanged(self, temp_dir, sample_rdf_file):
+        """Test that waiting for a quiescent input file returns after two equal samples."""
+        import time
+        
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        
+        start = time.monotonic()
+        pipeline._wait_for_stable_input(timeout=1.0, interval=0.01)
+        
+        assert time.monotonic() - start < 0.5
+    
+    def test_watch_filter_resolves_only_matching_names(self, temp_dir, sample_rdf_file, mocker):
+        """Test that unrelated paths are rejected without resolving them."""
+        watchfiles = pytest.importorskip("watchfiles")
+        
+        link = temp_dir / "library.rdf"
+        link.symlink_to(sample_rdf_file)
+        pipeline = BuildPipeline(BuildConfig(input_file=str(link), output_dir=str(temp_dir / "website")))
+        pipeline._watch_target = link.resolve()
+        pipeline._watch_path = os.path.abspath(link)
+        pipeline._watch_names = {link.name, link.resolve().name}
+        
+        resolve_spy = mocker.spy(Path, "resolve")
+        assert not pipeline._is_input_change(watchfiles.Change.modified, str(temp_dir / "notes.txt"))
+        assert pipeline._is_input_change(watchfiles.Change.modified, str(link))
+        assert resolve_spy.call_count == 0
+        
+        # Writes through the symlink target are still detected
+        assert pipeline._is_input_change(watchfiles.Change.modified, str(Path(sample_rdf_file).resolve()))
+    
+    def test_watch_mode_runs_initial_build_in_background(self, temp_dir, sample_rdf_file):
+        """Test that watch mode returns immediately and builds on the watcher thread."""
+        pytest.importorskip("watchfiles")
+        import time
+        import threading
+        
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        thread_names = []
+        pipeline.start_watch_mode(lambda percentage, message: thread_names.append(threading.current_thread().name))
+        
+        try:
+            deadline = time.monotonic() + 10
+            while not pipeline._build_history and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            pipeline.cleanup()
+        
+        assert pipeline._build_history[-1].success is True
+        assert thread_names
+        assert threading.main_thread().name not in thread_names
+    
+    def test_build_history_is_bounded(self, temp_dir, sample_rdf_file):
+        """Test that build history is capped while statistics cover all builds."""
+        from datetime import datetime
+        from zotero_webviewer.build_pipeline import BuildResult, BUILD_HISTORY_SIZE
+        
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        for i in range(BUILD_HISTORY_SIZE + 10):
+            pipeline._record_build(BuildResult(
+                success=i % 2 == 0,
+                duration=float(i + 1),
+                items_count=1,
+                collections_count=0,
+                files_generated=[],
+                errors=[],
+                warnings=[],
+                timestamp=datetime.now()
+            ))
+        
+        stats = pipeline.get_build_statistics()
+        
+        assert len(pipeline._build_history) == BUILD_HISTORY_SIZE
+        assert stats["total_builds"] == BUILD_HISTORY_SIZE + 10
+        assert stats["successful_builds"] == (BUILD_HISTORY_SIZE + 10) // 2
+        assert stats["fastest_build"] == 1.0
+        assert stats["slowest_build"] == float(BUILD_HISTORY_SIZE + 9)
+        assert "last_successful_build" in stats
+        assert "last_failed_build" in stats
+
+
+class TestLazyImports:
+    """Tests that heavy dependencies are only imported when needed."""
+    
+    def test_cli_import_does_not_load_rdflib_or_jinja2(self):
+        """Test that importing the CLI (e.g. for --help) skips rdflib and jinja2."""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, zotero_webviewer.cli; "
+            "print('rdflib' in sys.modules, 'jinja2' in sys.modules)"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        
+        assert output.stdout.strip() == "False False"
+    
+    def test_pipeline_components_created_on_first_use(self, temp_dir, sample_rdf_file):
+        """Test that pipeline components are created lazily and reused."""
+        pipeline = BuildPipeline(BuildConfig(input_file=sample_rdf_file, output_dir=str(temp_dir / "website")))
+        
+        assert "parser" not in vars(pipeline)
+        assert pipeline.parser is pipeline.parser
+        assert isinstance(pipeline.parser, RDFParser)
 
 
 class TestPerformanceAndScalability:
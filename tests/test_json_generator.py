@@ -2,8 +2,12 @@
 
 import json
 from pathlib import Path
+import pytest
+from zotero_webviewer import json_generator
 from zotero_webviewer.json_generator import (
-    JSONGenerator
+    JSONGenerator,
+    dump_json_bytes,
+    load_json_bytes
 )
 from zotero_webviewer.data_transformer import BibliographyItem, Collection, Author
 
@@ -122,6 +126,39 @@ class TestJSONGenerator:
         assert "searchable" in first_index_entry
         assert "keywords" in first_index_entry
     
+    def test_generate_item_files_matches_separate_generators(self, temp_dir, sample_bibliography_items):
+        """Test that the single-pass item files match the separately generated files."""
+        separate = JSONGenerator(str(temp_dir / "separate"))
+        fused = JSONGenerator(str(temp_dir / "fused"))
+        
+        expected = {
+            "bibliography": separate.generate_bibliography_json(sample_bibliography_items),
+            "search_index": separate.generate_search_index(sample_bibliography_items),
+        }
+        generated = fused.generate_item_files(sample_bibliography_items)
+        
+        assert set(generated) == set(expected)
+        for name, output_path in generated.items():
+            with open(output_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with open(expected[name], 'r', encoding='utf-8') as f:
+                expected_data = json.load(f)
+            data["metadata"].pop("generated_at")
+            expected_data["metadata"].pop("generated_at")
+            assert data == expected_data
+    
+    def test_generate_item_files_skips_unrequested_files(self, temp_dir, sample_bibliography_items):
+        """Test that passing None as a filename skips that file."""
+        generator = JSONGenerator(str(temp_dir))
+        
+        generated = generator.generate_item_files(sample_bibliography_items, bibliography_filename=None)
+        
+        assert list(generated) == ["search_index"]
+        assert not (temp_dir / "bibliography.json").exists()
+        assert generator.generate_item_files(
+            sample_bibliography_items, bibliography_filename=None, search_index_filename=None
+        ) == {}
+    
     def test_generate_combined_data(self, temp_dir, sample_bibliography_items, sample_collections):
         """Test generating combined data JSON file."""
         generator = JSONGenerator(str(temp_dir))
@@ -584,4 +621,37 @@ class TestJSONGeneratorErrorHandling:
         assert "minimal" in data["collections"]
         col_data = data["collections"]["minimal"]
         assert col_data["title"] == "Minimal Collection"
-        assert col_data["itemCount"] == 0
\ No newline at end of file
+        assert col_data["itemCount"] == 0
+
+
+class TestJSONSerialization:
+    """Test cases for the JSON serialization helpers."""
+    
+    SAMPLE_DATA = {
+        "title": "Über Maschinelles Lernen — 学习",
+        "year": 2023,
+        "authors": [{"name": "Müller, J."}, {"name": "O'Brien"}],
+        "abstract": 'Quotes "and" backslashes \\ and newlines\n',
+        "doi": None,
+        "nested": {"empty": [], "flag": True}
+    }
+    
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_dump_matches_stdlib_output(self, monkeypatch, use_orjson):
+        """Test that serialized output is identical with and without orjson."""
+        if use_orjson and not json_generator.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_generator, "ORJSON_AVAILABLE", use_orjson)
+        
+        expected = json.dumps(self.SAMPLE_DATA, ensure_ascii=False, indent=2).encode("utf-8")
+        
+        assert dump_json_bytes(self.SAMPLE_DATA) == expected
+    
+    def test_load_round_trip(self):
+        """Test that dumped bytes load back to the same data."""
+        assert load_json_bytes(dump_json_bytes(self.SAMPLE_DATA)) == self.SAMPLE_DATA
+    
+    def test_load_invalid_json_raises_value_error(self):
+        """Test that invalid JSON raises a ValueError regardless of backend."""
+        with pytest.raises(ValueError):
+            load_json_bytes(b"{not json")
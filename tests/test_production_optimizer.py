@@ -0,0 +1,373 @@
+"""Unit tests for production optimization functionality."""
+
+import gzip
+import json
+import os
+import shutil
+import pytest
+from zotero_webviewer import production_optimizer
+from zotero_webviewer.production_optimizer import ProductionOptimizer
+
+
+@pytest.fixture
+def site_dir(temp_dir):
+    """Create a small generated site to optimize."""
+    (temp_dir / "data").mkdir()
+    (temp_dir / "styles.css").write_text("body {\n    color: red;\n}\n", encoding="utf-8")
+    (temp_dir / "app.js").write_text("function add(a, b) {\n    return a + b;\n}\n", encoding="utf-8")
+    (temp_dir / "index.html").write_text("<html>\n  <body>\n    <p>Hi</p>\n  </body>\n</html>\n", encoding="utf-8")
+    with open(temp_dir / "data" / "bibliography.json", "w", encoding="utf-8") as f:
+        json.dump({"items": [{"id": "item1", "title": "Title"}]}, f, indent=2)
+    return temp_dir
+
+
+@pytest.fixture
+def regex_minifiers(monkeypatch):
+    """Use the built-in regex minifiers even if compiled minifiers are installed."""
+    monkeypatch.setattr(production_optimizer, "RCSSMIN_AVAILABLE", False)
+    monkeypatch.setattr(production_optimizer, "RJSMIN_AVAILABLE", False)
+    monkeypatch.setattr(production_optimizer, "MINIFY_HTML_AVAILABLE", False)
+
+
+class TestProductionOptimizer:
+    """Test cases for ProductionOptimizer class."""
+    
+    def test_optimize_all_minifies_files(self, site_dir, regex_minifiers):
+        """Test that all generated files are minified and reported."""
+        optimizer = ProductionOptimizer(str(site_dir))
+        
+        report = optimizer.optimize_all()
+        
+        assert (site_dir / "styles.css").read_text(encoding="utf-8") == "body{color:red}"
+        assert (site_dir / "app.js").read_text(encoding="utf-8") == "function add(a,b){\nreturn a+b;\n}"
+        assert (site_dir / "index.html").read_text(encoding="utf-8") == "<html><body><p>Hi</p></body></html>"
+        assert (site_dir / "data" / "bibliography.json").read_text(encoding="utf-8") == '{"items":[{"id":"item1","title":"Title"}]}'
+        
+        assert len(report["file_details"]) == 4
+        assert report["total_savings"] > 0
+        assert (site_dir / "styles.css.gz").exists()
+    
+    def test_compressed_files_match_optimized_content(self, site_dir):
+        """Test that every compressed file holds the final content of its source."""
+        (site_dir / "assets").mkdir()
+        (site_dir / "assets" / "extra.js").write_text("var  unminified = 1;\n", encoding="utf-8")
+        
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        for name in ("styles.css", "app.js", "index.html", "data/bibliography.json", "assets/extra.js"):
+            compressed = (site_dir / (name + ".gz")).read_bytes()
+            assert gzip.decompress(compressed) == (site_dir / name).read_bytes()
+    
+    def test_optimize_all_in_worker_processes(self, site_dir, temp_dir, monkeypatch):
+        """Test that large outputs are optimized in worker processes with the same result."""
+        sequential_dir = temp_dir.parent / (temp_dir.name + "-sequential")
+        shutil.copytree(site_dir, sequential_dir)
+        try:
+            ProductionOptimizer(str(sequential_dir)).optimize_all()
+            
+            monkeypatch.setattr(production_optimizer, "PARALLEL_MIN_BYTES", 0)
+            report = ProductionOptimizer(str(site_dir)).optimize_all()
+            
+            for name in ("styles.css", "app.js", "index.html", "data/bibliography.json"):
+                assert (site_dir / name).read_bytes() == (sequential_dir / name).read_bytes()
+            assert len(report["file_details"]) == 4
+            assert report["file_details"][str(site_dir / "styles.css")]["original_size"] == len("body {\n    color: red;\n}\n")
+        finally:
+            shutil.rmtree(sequential_dir)
+    
+    def test_worker_processes_are_not_forked(self, site_dir, monkeypatch, mocker):
+        """Test that the worker pool does not fork the possibly multi-threaded build process."""
+        monkeypatch.setattr(production_optimizer, "PARALLEL_MIN_BYTES", 0)
+        pool_spy = mocker.spy(production_optimizer, "ProcessPoolExecutor")
+        
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert pool_spy.call_count == 1
+        assert pool_spy.call_args.kwargs["mp_context"].get_start_method() != "fork"
+    
+    def test_compiled_minifiers_are_preferred(self, monkeypatch):
+        """Test that installed compiled minifiers replace the regex implementations."""
+        class Stub:
+            cssmin = staticmethod(lambda content: "css")
+            jsmin = staticmethod(lambda content: "js")
+            minify = staticmethod(lambda content, **options: "html")
+        
+        for module, flag in (("rcssmin", "RCSSMIN_AVAILABLE"), ("rjsmin", "RJSMIN_AVAILABLE"),
+                             ("minify_html", "MINIFY_HTML_AVAILABLE")):
+            monkeypatch.setattr(production_optimizer, module, Stub, raising=False)
+            monkeypatch.setattr(production_optimizer, flag, True)
+        
+        assert ProductionOptimizer._minify_css("a { }") == "css"
+        assert ProductionOptimizer._minify_javascript("var a = 1;") == "js"
+        assert ProductionOptimizer._minify_html("<p> </p>") == "html"
+    
+    def test_minify_css_preserves_strings(self, regex_minifiers):
+        """Test that CSS minification leaves string literals untouched."""
+        css = 'a::before {\n  content: "a  :  b /* c */" ;\n}\n/* note */ b > i { font: 1px \'x ; }\'; }'
+        
+        minified = ProductionOptimizer._minify_css(css)
+        
+        assert minified == 'a::before{content:"a  :  b /* c */"}b>i{font:1px \'x ; }\'}'
+    
+    def test_minify_javascript_preserves_literals(self, regex_minifiers):
+        """Test that JavaScript minification leaves string, template and regex literals untouched."""
+        js = (
+            'const s = "a  b // c";  // comment\n'
+            'const t = `x  ${ y ? `a  /* b */` : \'\' }`;\n'
+            'return text.replace(/ +\\/* /g, \' \') / 2 + +n;\n'
+        )
+        
+        minified = ProductionOptimizer._minify_javascript(js)
+        
+        assert minified == (
+            'const s="a  b // c";\n'
+            'const t=`x  ${ y ? `a  /* b */` : \'\' }`;\n'
+            'return text.replace(/ +\\/* /g,\' \')/2+ +n;'
+        )
+    
+    def test_minify_html_keeps_non_ascii_content(self, site_dir, regex_minifiers):
+        """Test that HTML minified as bytes keeps non-ASCII text and no-break spaces."""
+        (site_dir / "index.html").write_text("<p>Caf\u00e9</p>\n  <!-- note -->\n<p>\u00a0</p>\n", encoding="utf-8")
+        
+        ProductionOptimizer(str(site_dir)).optimize_html(site_dir / "index.html")
+        
+        assert (site_dir / "index.html").read_text(encoding="utf-8") == "<p>Caf\u00e9</p><p>\u00a0</p>"
+    
+    def test_generate_compressed_files_for_many_files(self, site_dir):
+        """Test that compressing many files concurrently writes a matching .gz for each."""
+        (site_dir / "assets").mkdir()
+        names = [f"assets/part{i}.js" for i in range(8)]
+        for i, name in enumerate(names):
+            (site_dir / name).write_text(f"var part = {i};\n" * (i + 1), encoding="utf-8")
+        
+        ProductionOptimizer(str(site_dir)).generate_compressed_files()
+        
+        for name in names + ["styles.css", "index.html", "data/bibliography.json"]:
+            assert gzip.decompress((site_dir / (name + ".gz")).read_bytes()) == (site_dir / name).read_bytes()
+    
+    def test_unchanged_files_are_not_rewritten(self, site_dir):
+        """Test that files minification leaves as they are keep their content, mtime and compressed files."""
+        (site_dir / "assets").mkdir()
+        (site_dir / "assets" / "extra.css").write_text("i{}", encoding="utf-8")
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        names = ["styles.css", "app.js", "index.html", "data/bibliography.json", "assets/extra.css"]
+        before = {name: (site_dir / name).stat().st_mtime_ns for name in names}
+        compressed_before = {name: (site_dir / (name + ".gz")).stat().st_mtime_ns for name in names}
+        (site_dir / production_optimizer.MANIFEST_FILENAME).unlink()
+        
+        report = ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        for name in names:
+            assert (site_dir / name).stat().st_mtime_ns == before[name]
+            assert (site_dir / (name + ".gz")).stat().st_mtime_ns == compressed_before[name]
+        detail = report["file_details"][str(site_dir / "styles.css")]
+        assert detail["original_size"] == detail["optimized_size"]
+    
+    def test_manifest_skips_unchanged_files(self, site_dir, mocker):
+        """Test that a second run skips files recorded in the manifest and redoes changed ones."""
+        first = ProductionOptimizer(str(site_dir)).optimize_all()
+        assert (site_dir / production_optimizer.MANIFEST_FILENAME).exists()
+        assert not (site_dir / (production_optimizer.MANIFEST_FILENAME + ".gz")).exists()
+        (site_dir / "app.js").write_text("var  changed = 1;\n", encoding="utf-8")
+        css_spy = mocker.spy(ProductionOptimizer, "_minify_css")
+        js_spy = mocker.spy(ProductionOptimizer, "_minify_javascript")
+        
+        second = ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert css_spy.call_count == 0
+        assert js_spy.call_count == 1
+        styles = str(site_dir / "styles.css")
+        assert second["file_details"][styles] == first["file_details"][styles]
+        assert gzip.decompress((site_dir / "app.js.gz").read_bytes()) == (site_dir / "app.js").read_bytes()
+    
+    def test_stale_compressed_files_are_regenerated(self, site_dir):
+        """Test that a compressed file older than its source is written again."""
+        optimizer = ProductionOptimizer(str(site_dir))
+        optimizer.generate_compressed_files()
+        compressed = site_dir / "styles.css.gz"
+        compressed.write_bytes(gzip.compress(b"stale"))
+        os.utime(compressed, ns=(0, 0))
+        
+        optimizer.generate_compressed_files()
+        
+        assert gzip.decompress(compressed.read_bytes()) == (site_dir / "styles.css").read_bytes()
+    
+    def test_asset_replaced_with_older_file_is_recompressed(self, site_dir):
+        """Test that compressed files follow content changes even when the new file is older."""
+        (site_dir / "assets").mkdir()
+        asset = site_dir / "assets" / "x.js"
+        asset.write_text("var a = 1;", encoding="utf-8")
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        asset.write_text("var b = 22;", encoding="utf-8")
+        os.utime(asset, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert gzip.decompress((site_dir / "assets" / "x.js.gz").read_bytes()) == b"var b = 22;"
+    
+    def test_libdeflate_is_preferred_for_gzip(self, site_dir, monkeypatch):
+        """Test that the libdeflate binding produces the gzip files when installed."""
+        levels = []
+        
+        class Stub:
+            @staticmethod
+            def gzip_compress(data, compresslevel):
+                levels.append(compresslevel)
+                return gzip.compress(data)
+        
+        monkeypatch.setattr(production_optimizer, "deflate", Stub, raising=False)
+        monkeypatch.setattr(production_optimizer, "DEFLATE_AVAILABLE", True)
+        
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert levels == [12] * 4
+        assert gzip.decompress((site_dir / "styles.css.gz").read_bytes()) == (site_dir / "styles.css").read_bytes()
+    
+    def test_brotli_and_zstandard_files_when_installed(self, site_dir, monkeypatch):
+        """Test that .br and .zst files are written next to .gz files when the encoders exist."""
+        class BrotliStub:
+            MODE_TEXT = 1
+            
+            @staticmethod
+            def compress(data, mode, quality):
+                return b"br:" + data
+        
+        class ZstdCompressorStub:
+            def __init__(self, level):
+                self.level = level
+            
+            def compress(self, data):
+                return b"zst:" + data
+        
+        class ZstandardStub:
+            ZstdCompressor = ZstdCompressorStub
+        
+        monkeypatch.setattr(production_optimizer, "brotli", BrotliStub, raising=False)
+        monkeypatch.setattr(production_optimizer, "BROTLI_AVAILABLE", True)
+        monkeypatch.setattr(production_optimizer, "zstandard", ZstandardStub, raising=False)
+        monkeypatch.setattr(production_optimizer, "ZSTANDARD_AVAILABLE", True)
+        (site_dir / "assets").mkdir()
+        (site_dir / "assets" / "extra.css").write_text("i { }", encoding="utf-8")
+        
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        for name in ("styles.css", "assets/extra.css"):
+            content = (site_dir / name).read_bytes()
+            assert (site_dir / (name + ".br")).read_bytes() == b"br:" + content
+            assert (site_dir / (name + ".zst")).read_bytes() == b"zst:" + content
+            assert gzip.decompress((site_dir / (name + ".gz")).read_bytes()) == content
+    
+    def test_no_optional_compressed_files_without_encoders(self, site_dir, monkeypatch):
+        """Test that only .gz files are written when brotli and zstandard are missing."""
+        monkeypatch.setattr(production_optimizer, "BROTLI_AVAILABLE", False)
+        monkeypatch.setattr(production_optimizer, "ZSTANDARD_AVAILABLE", False)
+        
+        ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert (site_dir / "styles.css.gz").exists()
+        assert not list(site_dir.rglob("*.br"))
+        assert not list(site_dir.rglob("*.zst"))
+    
+    def test_optimize_all_walks_output_once(self, site_dir, mocker):
+        """Test that files to minify and to compress are found in a single directory walk."""
+        (site_dir / "assets").mkdir()
+        (site_dir / "assets" / "extra.js").write_text("var a = 1;", encoding="utf-8")
+        scan_spy = mocker.spy(production_optimizer, "scan_files")
+        
+        report = ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert scan_spy.call_count == 1
+        assert str(site_dir / "assets" / "extra.js") not in report["file_details"]
+        assert (site_dir / "assets" / "extra.js.gz").exists()
+    
+    def test_gzip_output_is_reproducible(self, site_dir, temp_dir, monkeypatch):
+        """Test that rebuilding identical content produces byte-identical gzip files."""
+        import time
+        
+        monkeypatch.setattr(production_optimizer, "DEFLATE_AVAILABLE", False)
+        rebuilt_dir = temp_dir.parent / (temp_dir.name + "-rebuilt")
+        shutil.copytree(site_dir, rebuilt_dir)
+        try:
+            ProductionOptimizer(str(site_dir)).optimize_all()
+            monkeypatch.setattr(time, "time", lambda: 1234567890.0)
+            ProductionOptimizer(str(rebuilt_dir)).optimize_all()
+            
+            for name in ("styles.css.gz", "data/bibliography.json.gz"):
+                assert (site_dir / name).read_bytes() == (rebuilt_dir / name).read_bytes()
+        finally:
+            shutil.rmtree(rebuilt_dir)
+    
+    def test_minified_assets_are_only_compressed(self, site_dir, regex_minifiers):
+        """Test that pre-minified scripts and stylesheets are compressed but not rewritten."""
+        vendor = "var  keep = 1;\n// license\n"
+        (site_dir / "vendor.min.js").write_text(vendor, encoding="utf-8")
+        long_line = "a { color: red; }  " * 100
+        (site_dir / "bundle.css").write_text(long_line, encoding="utf-8")
+        
+        report = ProductionOptimizer(str(site_dir)).optimize_all()
+        
+        assert (site_dir / "vendor.min.js").read_text(encoding="utf-8") == vendor
+        assert (site_dir / "bundle.css").read_text(encoding="utf-8") == long_line
+        assert gzip.decompress((site_dir / "vendor.min.js.gz").read_bytes()) == vendor.encode("utf-8")
+        details = report["file_details"][str(site_dir / "vendor.min.js")]
+        assert details["original_size"] == details["optimized_size"]
+        assert (site_dir / "styles.css").read_text(encoding="utf-8") == "body{color:red}"
+    
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_optimize_json_compacts_data(self, temp_dir, monkeypatch, use_orjson):
+        """Test that JSON data files are compacted with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(production_optimizer, "ORJSON_AVAILABLE", use_orjson)
+        data = {"items": [{"title": "Über \"quoted\"", "year": 2020, "tags": []}], "total": 1.5}
+        json_file = temp_dir / "bibliography.json"
+        json_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        original_size = json_file.stat().st_size
+        optimizer = ProductionOptimizer(str(temp_dir))
+        
+        optimizer.optimize_json(json_file)
+        
+        compact = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        assert json_file.read_bytes() == compact
+        assert optimizer.stats["original_sizes"][str(json_file)] == original_size
+        assert optimizer.stats["optimized_sizes"][str(json_file)] == len(compact)
+    
+    def test_deployment_info_lists_files_with_sizes(self, site_dir):
+        """Test that deployment info lists visible files with relative paths, sizes and types."""
+        from zotero_webviewer.production_optimizer import DeploymentHelper
+        
+        helper = DeploymentHelper(str(site_dir))
+        helper.create_github_pages_config()
+        
+        info = helper.create_deployment_info()
+        
+        files = {entry["path"]: entry for entry in info["files"]}
+        assert set(files) == {"styles.css", "app.js", "index.html", "data/bibliography.json"}
+        assert files["data/bibliography.json"]["type"] == "json"
+        assert files["styles.css"]["size"] == (site_dir / "styles.css").stat().st_size
+        assert info["total_size"] == sum(entry["size"] for entry in info["files"])
+        assert helper.validate_deployment() == []
+    
+    def test_deployment_helper_walks_output_once(self, site_dir, mocker):
+        """Test that deployment info and validation share one directory walk."""
+        from zotero_webviewer.production_optimizer import DeploymentHelper
+        
+        (site_dir / "styles.css").unlink()
+        scan_spy = mocker.spy(production_optimizer, "scan_files")
+        helper = DeploymentHelper(str(site_dir))
+        
+        helper.create_deployment_info()
+        errors = helper.validate_deployment()
+        
+        assert scan_spy.call_count == 1
+        assert errors == ["Missing required file: styles.css"]
+    
+    def test_empty_file_has_zero_ratio(self, temp_dir):
+        """Test that optimizing an empty file does not divide by zero."""
+        css_file = temp_dir / "empty.css"
+        css_file.write_text("", encoding="utf-8")
+        optimizer = ProductionOptimizer(str(temp_dir))
+        
+        optimizer.optimize_css(css_file)
+        
+        assert optimizer.stats["compression_ratios"][str(css_file)] == 0.0
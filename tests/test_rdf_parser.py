@@ -1,5 +1,7 @@
 """Unit tests for RDF parser functionality."""
 
+import os
+import logging
 import pytest
 from rdflib import Graph, URIRef, Literal
 from rdflib.namespace import RDF, DC
@@ -58,6 +60,14 @@ class TestRDFParser:
         with pytest.raises(RDFParsingError, match="Path is not a file"):
             parser.parse_rdf_file(str(temp_dir))
     
+    def test_parse_unreadable_file(self, sample_rdf_file, mocker):
+        """Test that a file the parser cannot open reports a permission error."""
+        parser = RDFParser()
+        mocker.patch.object(Graph, "parse", side_effect=PermissionError(13, "Permission denied"))
+        
+        with pytest.raises(RDFParsingError, match="Permission denied accessing RDF file"):
+            parser.parse_rdf_file(sample_rdf_file)
+    
     def test_extract_bibliography_items_without_graph(self):
         """Test extracting items without parsing a graph first."""
         parser = RDFParser()
@@ -65,6 +75,16 @@ class TestRDFParser:
         with pytest.raises(RDFParsingError, match="No RDF graph available"):
             parser.extract_bibliography_items()
     
+    def test_iter_bibliography_items_matches_extract(self, sample_rdf_file):
+        """Test that the item generator yields the extracted items lazily and in order."""
+        parser = RDFParser()
+        parser.parse_rdf_file(sample_rdf_file)
+        
+        iterator = parser.iter_bibliography_items()
+        first = next(iterator)
+        
+        assert [first] + list(iterator) == parser.extract_bibliography_items()
+    
     def test_extract_bibliography_items_from_sample_data(self, sample_rdf_file):
         """Test extracting bibliography items from sample RDF data."""
         parser = RDFParser()
@@ -122,6 +142,19 @@ class TestRDFParser:
         assert ml_collection is not None
         assert len(ml_collection["item_ids"]) == 2
     
+    def test_extract_collection_data_with_preindexed_parts(self, sample_rdf_data):
+        """Test that pre-indexed parts match querying the graph directly."""
+        parser = RDFParser()
+        collection = URIRef("http://example.org/collection1")
+        
+        queried = parser._extract_collection_data(sample_rdf_data, collection)
+        indexed = parser._extract_collection_data(
+            sample_rdf_data, collection, list(queried["item_ids"])
+        )
+        
+        assert indexed == queried
+        assert len(indexed["item_ids"]) == 2
+    
     def test_assign_items_to_collections(self, sample_rdf_file):
         """Test assigning items to collections."""
         parser = RDFParser()
@@ -141,6 +174,34 @@ class TestRDFParser:
         assigned_items = [item for item in items if item.get("collections")]
         assert len(assigned_items) > 0
     
+    def test_assign_items_to_collections_keeps_order_without_duplicates(self):
+        """Test that collection IDs are appended once each, in collection order."""
+        items = [{"id": "a", "collections": ["c0"]}, {"id": "b"}]
+        collections = [
+            {"id": "c1", "item_ids": ["a", "b", "a"]},
+            {"id": "c0", "item_ids": ["a"]},
+            {"id": "c2", "item_ids": ["a", "missing"]},
+        ]
+        
+        RDFParser().assign_items_to_collections(items, collections)
+        
+        assert items[0]["collections"] == ["c0", "c1", "c2"]
+        assert items[1]["collections"] == ["c1"]
+    
+    def test_extracted_ids_are_plain_strings(self, sample_rdf_file):
+        """Test that item and collection ids are builtin str, not URIRef."""
+        parser = RDFParser()
+        parser.parse_rdf_file(sample_rdf_file)
+        
+        items = parser.extract_bibliography_items()
+        collections = parser.extract_collections()
+        
+        for item in items:
+            assert type(item["id"]) is str
+        for collection in collections:
+            assert type(collection["id"]) is str
+            assert all(type(item_id) is str for item_id in collection["item_ids"])
+    
     def test_validate_bibliography_data_integrity_empty_data(self):
         """Test validation with empty data."""
         parser = RDFParser()
@@ -211,6 +272,7 @@ class TestRDFParser:
         assert parser._extract_year_from_date("invalid") is None
         assert parser._extract_year_from_date("") is None
         assert parser._extract_year_from_date("23") is None  # Too short
+        assert parser._extract_year_from_date("\u00b2023") is None  # Not decimal
     
     def test_normalize_item_type(self):
         """Test item type normalization."""
@@ -233,6 +295,74 @@ class TestRDFParser:
         
         assert authors == []
     
+    def test_extract_authors_follows_sequence_order(self):
+        """Test that authors come out in rdf:_N order and stop at the first gap."""
+        from rdflib.namespace import FOAF
+        
+        graph = Graph()
+        seq = URIRef("http://example.org/authors")
+        for index, surname in ((10, "Tenth"), (2, "Second"), (1, "First"), (12, "AfterGap")):
+            person = URIRef(f"http://example.org/person{index}")
+            graph.add((person, RDF.type, FOAF.Person))
+            graph.add((person, FOAF.surname, Literal(surname)))
+            graph.add((seq, RDF[f"_{index}"], person))
+        
+        authors = RDFParser()._extract_authors(graph, seq)
+        
+        assert [author["surname"] for author in authors] == ["First", "Second"]
+    
+    def test_extract_authors_ignores_non_decimal_member_index(self):
+        """Test that a member predicate like rdf:_\u00b2 does not drop the sequence's authors."""
+        from rdflib.namespace import FOAF
+        
+        graph = Graph()
+        seq = URIRef("http://example.org/authors")
+        for index, surname in (("1", "First"), ("2", "Second"), ("\u00b2", "Superscript")):
+            person = URIRef(f"http://example.org/person-{surname}")
+            graph.add((person, RDF.type, FOAF.Person))
+            graph.add((person, FOAF.surname, Literal(surname)))
+            graph.add((seq, URIRef(f"{RDF}_{index}"), person))
+        
+        authors = RDFParser()._extract_authors(graph, seq)
+        
+        assert [author["surname"] for author in authors] == ["First", "Second"]
+    
+    def test_extract_item_data_splits_doi_and_url(self):
+        """Test that only doi.org URLs are taken as DOIs."""
+        graph = Graph()
+        item = URIRef("http://example.org/item")
+        other = URIRef("http://example.org/other")
+        graph.add((item, DC.title, Literal("Title")))
+        graph.add((item, DC.identifier, URIRef("https://dx.doi.org/10.1000/x")))
+        graph.add((other, DC.title, Literal("Other")))
+        graph.add((other, DC.identifier, URIRef("https://notdoi.org.example.com/paper")))
+        parser = RDFParser()
+        
+        item_data = parser._extract_item_data(graph, item, "article")
+        other_data = parser._extract_item_data(graph, other, "article")
+        
+        assert (item_data["doi"], item_data["url"]) == ("https://dx.doi.org/10.1000/x", "")
+        assert (other_data["doi"], other_data["url"]) == ("", "https://notdoi.org.example.com/paper")
+    
+    def test_shared_venue_is_resolved_once(self, mocker):
+        """Test that a journal shared by several items is looked up once per pass."""
+        graph = Graph()
+        journal = URIRef("http://example.org/journal")
+        graph.add((journal, DC.title, Literal("Shared Journal")))
+        for name in ("first", "second", "third"):
+            item = URIRef(f"http://example.org/{name}")
+            graph.add((item, RDF.type, URIRef("http://purl.org/net/biblio#Article")))
+            graph.add((item, DC.title, Literal(name)))
+            graph.add((item, URIRef("http://purl.org/dc/terms/isPartOf"), journal))
+        parser = RDFParser()
+        value_spy = mocker.spy(graph, "value")
+        
+        items = parser.extract_bibliography_items(graph)
+        
+        assert [item["venue"] for item in items] == ["Shared Journal"] * 3
+        assert [call.args for call in value_spy.call_args_list].count((journal, DC.title)) == 1
+        assert parser._venue_cache is None
+    
     def test_extract_author_data_complete(self, sample_rdf_data):
         """Test extracting complete author data."""
         parser = RDFParser()
@@ -316,6 +446,48 @@ class TestRDFParserEdgeCases:
         with pytest.raises(RDFDataIntegrityError, match="No bibliography items found"):
             parser.parse_rdf_file(str(empty_content_file))
     
+    def test_parse_with_configured_store(self, sample_rdf_file):
+        """Test that graphs use the configured rdflib store and unknown stores are reported."""
+        from rdflib.plugins.stores.memory import SimpleMemory
+        
+        graph = RDFParser(store="SimpleMemory").parse_rdf_file(sample_rdf_file)
+        
+        assert isinstance(graph.store, SimpleMemory)
+        assert len(graph) > 0
+        with pytest.raises(RDFParsingError, match="RDF store 'NoSuchStore' is not available"):
+            RDFParser(store="NoSuchStore").parse_rdf_file(sample_rdf_file)
+    
+    def test_validate_parsed_graph_namespace_warning(self, temp_dir, caplog):
+        """Test that the Zotero namespace warning depends on predicates, not on triple order."""
+        typed_only = temp_dir / "typed_only.rdf"
+        typed_only.write_text('''<?xml version="1.0"?>
+        <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+                 xmlns:ex="http://example.org/">
+            <rdf:Description rdf:about="http://example.org/book">
+                <rdf:type rdf:resource="http://purl.org/net/biblio#Book"/>
+                <ex:a>1</ex:a><ex:b>2</ex:b><ex:c>3</ex:c>
+            </rdf:Description>
+        </rdf:RDF>''')
+        zotero_typed = temp_dir / "zotero_typed.rdf"
+        zotero_typed.write_text('''<?xml version="1.0"?>
+        <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+                 xmlns:z="http://www.zotero.org/namespaces/export#"
+                 xmlns:ex="http://example.org/">
+            <rdf:Description rdf:about="http://example.org/book">
+                <rdf:type rdf:resource="http://purl.org/net/biblio#Book"/>
+                <ex:a>1</ex:a><ex:b>2</ex:b><ex:c>3</ex:c>
+                <z:language>en</z:language>
+            </rdf:Description>
+        </rdf:RDF>''')
+        parser = RDFParser()
+        
+        with caplog.at_level(logging.WARNING, logger="zotero_webviewer.rdf_parser"):
+            parser.parse_rdf_file(str(typed_only))
+            parser.parse_rdf_file(str(zotero_typed))
+        
+        warnings = [record.getMessage() for record in caplog.records if "no Zotero namespaces" in record.getMessage()]
+        assert warnings == [f"RDF file may not be a Zotero export (no Zotero namespaces found): {typed_only}"]
+    
     def test_extract_item_data_minimal_data(self, sample_rdf_data):
         """Test extracting item data with minimal information."""
         parser = RDFParser()
@@ -389,4 +561,108 @@ class TestRDFParserEdgeCases:
         
         assert any("invalid authors data structure" in issue for issue in issues)
         assert any("is not a dictionary" in issue for issue in issues)
-        assert any("has no name information" in issue for issue in issues)
\ No newline at end of file
+        assert any("has no name information" in issue for issue in issues)
+
+
+class TestRDFParserCache:
+    """Test the on-disk cache of parse and extraction results."""
+    
+    def _parse_and_extract(self, parser, rdf_file):
+        graph = parser.parse_rdf_file(rdf_file)
+        items = parser.extract_bibliography_items(graph)
+        collections = parser.extract_collections(graph)
+        return graph, items, collections
+    
+    def test_cache_disabled_by_default(self, sample_rdf_file):
+        """Test that no cache is written without a cache directory."""
+        parser = RDFParser()
+        self._parse_and_extract(parser, sample_rdf_file)
+        
+        assert parser.cache_dir is None
+    
+    def test_cache_hit_skips_parsing(self, sample_rdf_file, temp_dir, mocker):
+        """Test that an unchanged file is served from the cache."""
+        cache_dir = temp_dir / "cache"
+        _, items, collections = self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+        
+        parse_spy = mocker.spy(Graph, "parse")
+        parser = RDFParser(cache_dir=str(cache_dir))
+        graph, cached_items, cached_collections = self._parse_and_extract(parser, sample_rdf_file)
+        
+        assert parse_spy.call_count == 0
+        assert len(graph) > 0
+        assert cached_items == items
+        assert cached_collections == collections
+    
+    def test_cache_results_are_only_served_once(self, sample_rdf_file, temp_dir):
+        """Test that a second extraction re-reads the graph instead of the cache."""
+        cache_dir = temp_dir / "cache"
+        self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        
+        parser = RDFParser(cache_dir=str(cache_dir))
+        _, items, _ = self._parse_and_extract(parser, sample_rdf_file)
+        items[0]["title"] = "Modified"
+        
+        assert parser.extract_bibliography_items() != items
+    
+    def test_cache_miss_after_file_change(self, sample_rdf_file, temp_dir):
+        """Test that modifying the file invalidates the cache entry."""
+        cache_dir = temp_dir / "cache"
+        self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        
+        stat = os.stat(sample_rdf_file)
+        os.utime(sample_rdf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+    
+    def test_cache_keyed_by_content_hash_survives_touch(self, sample_rdf_file, temp_dir, mocker):
+        """Test that a content-hash key still hits after the file's mtime changes."""
+        cache_dir = temp_dir / "cache"
+        parser = RDFParser(cache_dir=str(cache_dir))
+        parser.parse_rdf_file(sample_rdf_file, content_hash="abc123")
+        parser.extract_bibliography_items()
+        parser.extract_collections()
+        
+        stat = os.stat(sample_rdf_file)
+        os.utime(sample_rdf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        parse_spy = mocker.spy(Graph, "parse")
+        RDFParser(cache_dir=str(cache_dir)).parse_rdf_file(sample_rdf_file, content_hash="abc123")
+        
+        assert parse_spy.call_count == 0
+    
+    def test_cache_miss_after_format_version_change(self, sample_rdf_file, temp_dir, monkeypatch, mocker):
+        """Test that entries written under another cache format version are not served."""
+        cache_dir = temp_dir / "cache"
+        self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        
+        monkeypatch.setattr("zotero_webviewer.rdf_parser._CACHE_FORMAT_VERSION", 0)
+        parse_spy = mocker.spy(Graph, "parse")
+        self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        
+        assert parse_spy.call_count == 1
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+    
+    def test_corrupt_cache_entry_is_ignored(self, sample_rdf_file, temp_dir):
+        """Test that an unreadable cache entry falls back to parsing."""
+        cache_dir = temp_dir / "cache"
+        self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        for cache_file in cache_dir.glob("*.pkl"):
+            cache_file.write_bytes(b"not a pickle")
+        
+        _, items, _ = self._parse_and_extract(RDFParser(cache_dir=str(cache_dir)), sample_rdf_file)
+        
+        assert len(items) > 0
+    
+    def test_cache_eviction(self, sample_rdf_file, temp_dir):
+        """Test that old cache entries are evicted beyond the entry limit."""
+        cache_dir = temp_dir / "cache"
+        stat = os.stat(sample_rdf_file)
+        
+        for i in range(3):
+            os.utime(sample_rdf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + i * 1_000_000_000))
+            self._parse_and_extract(RDFParser(cache_dir=str(cache_dir), max_cache_entries=2), sample_rdf_file)
+        
+        assert len(list(cache_dir.glob("*.pkl"))) == 2